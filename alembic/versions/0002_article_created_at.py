@@ -0,0 +1,28 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002_article_created_at"
+down_revision: Union[str, None] = "0001_create_core_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_created_at_id",
+            "articles",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_created_at_id", table_name="articles")
+    op.drop_column("articles", "created_at")
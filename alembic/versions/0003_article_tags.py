@@ -0,0 +1,37 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003_article_tags"
+down_revision: Union[str, None] = "0002_article_created_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tag_counts",
+        sa.Column("tag", sa.String(), primary_key=True),
+        sa.Column("articles_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_tag_counts_articles_count", "tag_counts", ["articles_count"])
+    op.execute(
+        "INSERT INTO tag_counts (tag, articles_count) "
+        "SELECT tag, count(DISTINCT id) FROM articles, unnest(tag_list) AS tag GROUP BY tag"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_tag_list",
+            "articles",
+            ["tag_list"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_tag_list", table_name="articles")
+    op.drop_index("ix_tag_counts_articles_count", table_name="tag_counts")
+    op.drop_table("tag_counts")
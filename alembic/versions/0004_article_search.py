@@ -0,0 +1,51 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from core.config import settings
+
+revision: str = "0004_article_search"
+down_revision: Union[str, None] = "0003_article_tags"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{settings.search_language}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{settings.search_language}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{settings.search_language}', coalesce(body, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        low, high = conn.execute(sa.text("SELECT min(id), max(id) FROM articles")).one()
+        if low is not None:
+            for start in range(low, high + 1, BATCH_SIZE):
+                conn.execute(
+                    sa.text(
+                        f"UPDATE articles SET search_vector = {SEARCH_VECTOR_SQL} "
+                        "WHERE id >= :start AND id < :stop AND search_vector IS NULL"
+                    ),
+                    {"start": start, "stop": start + BATCH_SIZE},
+                )
+            conn.execute(sa.text(f"UPDATE articles SET search_vector = {SEARCH_VECTOR_SQL} WHERE search_vector IS NULL"))
+
+        op.create_index(
+            "ix_articles_search_vector",
+            "articles",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_search_vector", table_name="articles")
+    op.drop_column("articles", "search_vector")
@@ -0,0 +1,25 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005_comment_ordering_index"
+down_revision: Union[str, None] = "0004_article_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_article_id_id",
+            "comments",
+            ["article_id", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_comments_article_id", table_name="comments", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_comments_article_id", "comments", ["article_id"], postgresql_concurrently=True)
+        op.drop_index("ix_comments_article_id_id", table_name="comments", postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006_article_comments_count"
+down_revision: Union[str, None] = "0005_comment_ordering_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("comments_count", sa.Integer(), nullable=False, server_default="0"))
+
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        low, high = conn.execute(sa.text("SELECT min(id), max(id) FROM articles")).one()
+        if low is None:
+            return
+        for start in range(low, high + 1, BATCH_SIZE):
+            conn.execute(
+                sa.text(
+                    "UPDATE articles a SET comments_count = c.n "
+                    "FROM (SELECT article_id, count(*) AS n FROM comments "
+                    "WHERE article_id >= :start AND article_id < :stop GROUP BY article_id) c "
+                    "WHERE a.id = c.article_id"
+                ),
+                {"start": start, "stop": start + BATCH_SIZE},
+            )
+
+
+def downgrade() -> None:
+    op.drop_column("articles", "comments_count")
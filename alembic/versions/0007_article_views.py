@@ -0,0 +1,36 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0007_article_views"
+down_revision: Union[str, None] = "0006_article_comments_count"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("views_count", sa.BigInteger(), nullable=False, server_default="0"))
+    op.create_table(
+        "article_view_buckets",
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("views", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_article_view_buckets_bucket_start", "article_view_buckets", ["bucket_start"])
+    op.create_table(
+        "trending_articles",
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("views", sa.BigInteger(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_trending_articles_score", "trending_articles", ["score"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trending_articles_score", table_name="trending_articles")
+    op.drop_table("trending_articles")
+    op.drop_index("ix_article_view_buckets_bucket_start", table_name="article_view_buckets")
+    op.drop_table("article_view_buckets")
+    op.drop_column("articles", "views_count")
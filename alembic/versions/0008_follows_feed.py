@@ -0,0 +1,46 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008_follows_feed"
+down_revision: Union[str, None] = "0007_article_views"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("followers_count", sa.Integer(), nullable=False, server_default="0"))
+    op.create_table(
+        "follows",
+        sa.Column("follower_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("followee_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_follows_followee_id_follower_id", "follows", ["followee_id", "follower_id"])
+    op.create_table(
+        "timeline_entries",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_timeline_entries_article_id", "timeline_entries", ["article_id"])
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_author_id_created_at_id",
+            "articles",
+            ["author_id", "created_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_articles_author_id_created_at_id", table_name="articles", postgresql_concurrently=True)
+    op.drop_index("ix_timeline_entries_article_id", table_name="timeline_entries")
+    op.drop_table("timeline_entries")
+    op.drop_index("ix_follows_followee_id_follower_id", table_name="follows")
+    op.drop_table("follows")
+    op.drop_column("users", "followers_count")
@@ -0,0 +1,24 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.config import settings
+
+revision: str = "0009_feed_pull_mode"
+down_revision: Union[str, None] = "0008_follows_feed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("feed_pull", sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.execute(
+        sa.text("UPDATE users SET feed_pull = true WHERE followers_count > :max_followers").bindparams(
+            max_followers=settings.feed_fanout_max_followers
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "feed_pull")
@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from typing import Awaitable, Callable, Dict
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from benchmarks.common import dump_json, print_table
+from core.database import AsyncSessionLocal, dispose_engine, init_engine
+from models import Article
+from repositories.article_repo import ArticleRepository
+
+
+async def seed(session: AsyncSession, comments: int) -> int:
+    marker = uuid.uuid4().hex[:12]
+    user_id = (
+        await session.execute(
+            text("INSERT INTO users (username, email, password_hash) VALUES (:name, :email, 'x') RETURNING id"),
+            {"name": f"bench-cascade-{marker}", "email": f"bench-cascade-{marker}@example.com"},
+        )
+    ).scalar_one()
+    article_id = (
+        await session.execute(
+            text(
+                "INSERT INTO articles (title, description, body, author_id) "
+                "VALUES ('cascade', 'cascade', 'cascade', :user_id) RETURNING id"
+            ),
+            {"user_id": user_id},
+        )
+    ).scalar_one()
+    await session.execute(
+        text(
+            "INSERT INTO comments (body, author_id, article_id) "
+            "SELECT 'comment ' || n, :user_id, :article_id FROM generate_series(1, :n) AS n"
+        ),
+        {"user_id": user_id, "article_id": article_id, "n": comments},
+    )
+    await session.flush()
+    return article_id
+
+
+async def orm_cascade(session: AsyncSession, article_id: int) -> None:
+    article = await session.get(Article, article_id, options=[selectinload(Article.comments)])
+    await session.delete(article)
+    await session.flush()
+
+
+async def database_cascade(session: AsyncSession, article_id: int) -> None:
+    repo = ArticleRepository(session)
+    await repo.delete(await repo.get_by_id(article_id))
+
+
+async def measure(name: str, delete: Callable[[AsyncSession, int], Awaitable[None]], comments: int) -> Dict[str, float]:
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = init_engine()
+    async with AsyncSessionLocal() as session:
+        try:
+            article_id = await seed(session, comments)
+            event.listen(engine.sync_engine, "before_cursor_execute", count)
+            tracemalloc.start()
+            started = time.perf_counter()
+            await delete(session, article_id)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+            remaining = (
+                await session.execute(text("SELECT count(*) FROM comments WHERE article_id = :id"), {"id": article_id})
+            ).scalar_one()
+        finally:
+            await session.rollback()
+    return {
+        "path": name,
+        "seconds": round(elapsed, 3),
+        "statements": statements,
+        "peak_mib": round(peak / 1024 / 1024, 1),
+        "comments_left": remaining,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        rows = [await measure("database cascade (after)", database_cascade, args.comments)]
+        if not args.skip_orm:
+            rows.append(await measure("orm cascade, children loaded (before)", orm_cascade, args.comments))
+    finally:
+        await dispose_engine()
+    print_table(rows, f"DELETE article with {args.comments} comments (rolled back)")
+    if args.output:
+        dump_json(args.output, {"results": rows, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cost of deleting an article with a large comment set")
+    parser.add_argument("--comments", type=int, default=100_000)
+    parser.add_argument("--skip-orm", action="store_true", help="only run the single-statement path")
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,101 @@
+import argparse
+import json
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from benchmarks.common import dump_json, print_table
+from models import Article
+from schemas.article import ArticleListOut, ArticleOut
+
+SummaryRow = namedtuple("SummaryRow", "id title description tag_list author_id created_at body")
+SummaryRowNoBody = namedtuple("SummaryRowNoBody", "id title description tag_list author_id created_at")
+
+
+def _values(n: int, body_size: int) -> List[dict]:
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "title": f"Article {i}",
+            "description": f"Description of article {i}",
+            "body": "lorem ipsum " * (body_size // 12),
+            "tag_list": ["python", "postgres", f"tag-{i % 7}"],
+            "author_id": i % 50 + 1,
+            "created_at": created,
+        }
+        for i in range(n)
+    ]
+
+
+def orm_path(values: List[dict]) -> bytes:
+    entities = [Article(**v) for v in values]
+    content = {"articles": [ArticleOut.model_validate(a, from_attributes=True) for a in entities], "next_cursor": None}
+    adapter = TypeAdapter(ArticleListOut)
+    validated = adapter.validate_python(content, from_attributes=True)
+    jsonable = adapter.dump_python(validated, mode="json")
+    return json.dumps(jsonable, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def lean_path(values: List[dict]) -> bytes:
+    rows = [SummaryRow(**v) for v in values]
+    page = ArticleListOut.model_validate({"articles": rows, "next_cursor": None}, from_attributes=True)
+    return page.model_dump_json(exclude_unset=True).encode()
+
+
+def lean_path_without_body(values: List[dict]) -> bytes:
+    rows = [SummaryRowNoBody(**{k: v for k, v in value.items() if k != "body"}) for value in values]
+    page = ArticleListOut.model_validate({"articles": rows, "next_cursor": None}, from_attributes=True)
+    return page.model_dump_json(exclude_unset=True).encode()
+
+
+def measure(name: str, fn: Callable[[List[dict]], bytes], values: List[dict], iterations: int) -> Dict[str, float]:
+    fn(values)
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    payload = fn(values)
+    snapshot_after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename") if stat.count_diff > 0)
+
+    started = time.process_time()
+    for _ in range(iterations):
+        fn(values)
+    cpu = (time.process_time() - started) / iterations
+    return {
+        "path": name,
+        "cpu_ms_per_request": round(cpu * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_allocations": allocations,
+        "response_bytes": len(payload),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    values = _values(args.items, args.body_size)
+    rows = [
+        measure("orm + double validation (before)", orm_path, values, args.iterations),
+        measure("column projection (after)", lean_path, values, args.iterations),
+        measure("column projection, include_body=false", lean_path_without_body, values, args.iterations),
+    ]
+    print_table(rows, f"GET /api/articles serialization, {args.items} items, body ~{args.body_size} bytes")
+    if args.output:
+        dump_json(args.output, {"results": rows, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-request CPU and allocations of the article list response path")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--body-size", type=int, default=4000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,98 @@
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+BENCH_PASSWORD = "bench-password"
+
+
+def bench_email(i: int) -> str:
+    return f"bench-user-{i}@example.com"
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+@dataclass
+class LatencyRecorder:
+    name: str
+    samples: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        if ok:
+            self.samples.append(seconds)
+        else:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        values = sorted(self.samples)
+        return {
+            "name": self.name,
+            "count": len(values),
+            "errors": self.errors,
+            "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "max_ms": round((values[-1] if values else 0.0) * 1000, 2),
+        }
+
+
+class Timer:
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+
+def print_table(rows: List[Dict[str, float]], title: Optional[str] = None) -> None:
+    if title:
+        print(f"\n{title}")
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+
+def dump_json(path: str, payload: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def load_json(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _change(current: float, previous: float) -> str:
+    if not previous:
+        return ""
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def compare(current: List[Dict[str, float]], baseline: List[Dict[str, float]], metrics=("rps", "p50_ms", "p95_ms", "p99_ms")) -> List[Dict[str, float]]:
+    previous = {row["name"]: row for row in baseline}
+    rows = []
+    for row in current:
+        base = previous.get(row["name"])
+        entry = {"name": row["name"]}
+        for metric in metrics:
+            entry[metric] = row[metric]
+            entry[f"{metric} vs base"] = _change(row[metric], base[metric]) if base else "new"
+        rows.append(entry)
+    return rows
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
+
+from sqlalchemy import insert, text
+
+from benchmarks.common import BENCH_PASSWORD, bench_email
+from core.database import AsyncUnitOfWork, dispose_engine, init_engine
+from core.security import hash_password
+from models import Article, Comment, User
+from repositories.article_repo import search_vector_sql
+from repositories.import_repo import ImportRepository
+from repositories.tag_repo import TagRepository
+
+WORDS = (
+    "postgres python async index query cache latency replica cursor pool vacuum planner "
+    "join tuple lock commit stream batch shard queue worker schema token session route"
+).split()
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _zipf_weights(n: int, s: float) -> List[float]:
+    return [1 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def _cumulative(weights: List[float]) -> List[float]:
+    return list(itertools.accumulate(weights))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def _chunks(items: List[dict], size: int) -> Iterator[List[dict]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def generate(args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    password_hash = hash_password(BENCH_PASSWORD)
+    users = [
+        {"id": i + 1, "username": f"bench-user-{i}", "email": bench_email(i), "password_hash": password_hash, "bio": _text(rng, 8)}
+        for i in range(args.users)
+    ]
+
+    tags = [f"tag-{k}" for k in range(args.tags)]
+    tag_weights = _cumulative(_zipf_weights(args.tags, 1.1))
+    author_ids = range(1, args.users + 1)
+    author_weights = _cumulative(_zipf_weights(args.users, 0.8))
+    articles = []
+    for i in range(args.articles):
+        articles.append(
+            {
+                "id": i + 1,
+                "title": _text(rng, 6),
+                "description": _text(rng, 15),
+                "body": _text(rng, args.body_words),
+                "tag_list": sorted(set(rng.choices(tags, cum_weights=tag_weights, k=rng.randint(1, 5)))),
+                "author_id": rng.choices(author_ids, cum_weights=author_weights)[0],
+                "created_at": EPOCH + timedelta(seconds=i * 60 + rng.randint(0, 59)),
+            }
+        )
+
+    article_weights = _zipf_weights(args.articles, args.comment_skew)
+    rng.shuffle(article_weights)
+    commented = rng.choices(range(1, args.articles + 1), weights=article_weights, k=args.comments)
+    comments = [
+        {"id": i + 1, "body": _text(rng, rng.randint(5, 40)), "author_id": rng.randint(1, args.users), "article_id": article_id}
+        for i, article_id in enumerate(commented)
+    ]
+    return users, articles, comments
+
+
+async def load(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    users, articles, comments = generate(args)
+    print(f"generated {len(users)} users, {len(articles)} articles, {len(comments)} comments "
+          f"in {time.perf_counter() - started:.1f}s (seed={args.seed})")
+
+    init_engine()
+    try:
+        async with AsyncUnitOfWork() as session:
+            await session.execute(text("TRUNCATE users, articles, comments, tag_counts RESTART IDENTITY CASCADE"))
+            for model, rows in ((User, users), (Article, articles), (Comment, comments)):
+                for chunk in _chunks(rows, args.batch_size):
+                    await session.execute(insert(model), chunk)
+                await session.commit()
+                print(f"  {model.__tablename__}: {len(rows)} rows")
+            await session.execute(text(f"UPDATE articles SET search_vector = {search_vector_sql()}"))
+            await session.execute(
+                text(
+                    "UPDATE articles a SET comments_count = c.n "
+                    "FROM (SELECT article_id, count(*) AS n FROM comments GROUP BY article_id) c "
+                    "WHERE a.id = c.article_id"
+                )
+            )
+            await TagRepository(session).rebuild()
+            imports = ImportRepository(session)
+            for table in ("users", "articles", "comments"):
+                await imports.sync_sequence(table)
+            await session.commit()
+            await session.execute(text("ANALYZE users, articles, comments, tag_counts"))
+    finally:
+        await dispose_engine()
+    print(f"loaded in {time.perf_counter() - started:.1f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load a deterministic benchmark dataset (TRUNCATES users, articles and comments)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--comments", type=int, default=200000)
+    parser.add_argument("--tags", type=int, default=200)
+    parser.add_argument("--body-words", type=int, default=300)
+    parser.add_argument("--comment-skew", type=float, default=1.2, help="zipf exponent of comments per article")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--yes", action="store_true", help="confirm wiping the target database")
+    args = parser.parse_args()
+    if not args.yes:
+        parser.error("this wipes users, articles and comments; pass --yes to confirm")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(load(parse_args()))
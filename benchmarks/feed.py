@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Row, insert, text
+
+from benchmarks.common import LatencyRecorder, dump_json, print_table
+from core.database import AsyncSessionLocal, AsyncUnitOfWork, dispose_engine, init_engine
+from models import Follow
+from repositories.feed_repo import FeedRepository
+
+PULL_QUERY = text(
+    "SELECT a.id, a.title, a.description, a.tag_list, a.author_id, a.created_at, a.comments_count "
+    "FROM articles a JOIN follows f ON f.followee_id = a.author_id "
+    "WHERE f.follower_id = :user_id AND (CAST(:created_at AS timestamptz) IS NULL OR (a.created_at, a.id) < (:created_at, CAST(:id AS integer))) "
+    "ORDER BY a.created_at DESC, a.id DESC LIMIT :limit"
+)
+
+Page = Callable[[int, Optional[Tuple[datetime, int]]], Awaitable[List[Row]]]
+
+
+def follow_graph(args: argparse.Namespace, users: List[int]) -> List[dict]:
+    rng = random.Random(args.seed)
+    popularity = [1 / (rank ** args.skew) for rank in range(1, len(users) + 1)]
+    rng.shuffle(popularity)
+    edges = []
+    for follower in users:
+        count = min(len(users) - 1, int(rng.paretovariate(1.5) * args.follows))
+        followees = set(rng.choices(users, weights=popularity, k=count))
+        followees.discard(follower)
+        edges.extend({"follower_id": follower, "followee_id": followee} for followee in followees)
+    return edges
+
+
+async def seed(args: argparse.Namespace) -> List[int]:
+    async with AsyncUnitOfWork() as session:
+        users = list((await session.execute(text("SELECT id FROM users ORDER BY id"))).scalars())
+        if len(users) < 2:
+            raise SystemExit("run benchmarks.datagen first")
+        edges = follow_graph(args, users)
+        await session.execute(text("TRUNCATE follows, timeline_entries"))
+        for start in range(0, len(edges), args.batch_size):
+            await session.execute(insert(Follow), edges[start:start + args.batch_size])
+        await session.execute(text("UPDATE users SET followers_count = 0, feed_pull = false WHERE followers_count <> 0 OR feed_pull"))
+        await session.execute(
+            text(
+                "UPDATE users u SET followers_count = f.n "
+                "FROM (SELECT followee_id, count(*) AS n FROM follows GROUP BY followee_id) f "
+                "WHERE u.id = f.followee_id"
+            )
+        )
+        await session.execute(
+            text("UPDATE users SET feed_pull = true WHERE followers_count > :max_followers"),
+            {"max_followers": args.fanout_max_followers},
+        )
+        started = time.perf_counter()
+        await session.execute(
+            text(
+                "INSERT INTO timeline_entries (user_id, created_at, article_id, author_id) "
+                "SELECT f.follower_id, a.created_at, a.id, a.author_id "
+                "FROM follows f JOIN users u ON u.id = f.followee_id AND NOT u.feed_pull "
+                "CROSS JOIN LATERAL (SELECT id, created_at, author_id FROM articles WHERE author_id = f.followee_id "
+                "ORDER BY created_at DESC, id DESC LIMIT :backfill) a"
+            ),
+            {"backfill": args.backfill},
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE follows, timeline_entries, users"))
+        stats = (
+            await session.execute(
+                text(
+                    "SELECT max(followers_count), percentile_cont(0.5) WITHIN GROUP (ORDER BY followers_count), "
+                    "count(*) FILTER (WHERE followers_count > :max_followers), "
+                    "(SELECT count(*) FROM follows), (SELECT count(*) FROM timeline_entries) FROM users"
+                ),
+                {"max_followers": args.fanout_max_followers},
+            )
+        ).one()
+    print(
+        f"{stats[3]} follows, max followers {stats[0]}, median {stats[1]:.0f}, "
+        f"{stats[2]} authors above the fan-out threshold, {stats[4]} timeline rows "
+        f"(built in {time.perf_counter() - started:.1f}s)"
+    )
+    return users
+
+
+async def read_pages(name: str, page: Page, readers: List[int], pages: int) -> Dict[str, float]:
+    recorder = LatencyRecorder(name)
+    started = time.perf_counter()
+    for user_id in readers:
+        after = None
+        for _ in range(pages):
+            t = time.perf_counter()
+            rows = await page(user_id, after)
+            recorder.record(time.perf_counter() - t)
+            if not rows:
+                break
+            after = (rows[-1].created_at, rows[-1].id)
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def measure_reads(args: argparse.Namespace, users: List[int]) -> List[Dict[str, float]]:
+    readers = random.Random(args.seed + 1).sample(users, min(args.readers, len(users)))
+    async with AsyncSessionLocal() as session:
+        feed = FeedRepository(session)
+
+        async def hybrid(user_id: int, after: Optional[Tuple[datetime, int]]) -> List[Row]:
+            return await feed.page(user_id, limit=args.limit, after=after)
+
+        async def pull(user_id: int, after: Optional[Tuple[datetime, int]]) -> List[Row]:
+            created_at, article_id = after or (None, None)
+            params = {"user_id": user_id, "created_at": created_at, "id": article_id, "limit": args.limit}
+            return (await session.execute(PULL_QUERY, params)).all()
+
+        rows = []
+        for name, page in (("join on read (before)", pull), ("hybrid feed (after)", hybrid)):
+            await read_pages(name, page, readers[:10], args.pages)
+            rows.append(await read_pages(name, page, readers, args.pages))
+        await session.rollback()
+    return rows
+
+
+async def measure_fan_out(args: argparse.Namespace) -> List[Dict[str, float]]:
+    rows = []
+    async with AsyncSessionLocal() as session:
+        authors = (
+            await session.execute(text("SELECT id, followers_count FROM users WHERE followers_count > 0 ORDER BY followers_count DESC, id"))
+        ).all()
+        picks = [authors[0], authors[len(authors) // 10], authors[len(authors) // 2], authors[-1]] if authors else []
+        feed = FeedRepository(session)
+        for author in picks:
+            article = (
+                await session.execute(
+                    text(
+                        "INSERT INTO articles (title, description, body, author_id) "
+                        "VALUES ('fan-out bench', '', '', :author_id) RETURNING id, created_at"
+                    ),
+                    {"author_id": author.id},
+                )
+            ).one()
+            await session.execute(text("UPDATE users SET feed_pull = false WHERE id = :id"), {"id": author.id})
+            started = time.perf_counter()
+            inserted = await feed.fan_out(article.id, author.id, article.created_at)
+            elapsed = time.perf_counter() - started
+            await session.rollback()
+            rows.append(
+                {
+                    "followers": author.followers_count,
+                    "timeline_rows": inserted,
+                    "fan_out_ms": round(elapsed * 1000, 2),
+                    "hybrid_path": "push" if author.followers_count <= args.fanout_max_followers else "pull on read",
+                }
+            )
+    return rows
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_engine()
+    try:
+        users = await seed(args)
+        reads = await measure_reads(args, users)
+        writes = await measure_fan_out(args)
+    finally:
+        await dispose_engine()
+    print_table(reads, f"feed pages: {args.readers} readers x {args.pages} pages of {args.limit}")
+    print_table(writes, "fan-out cost of one new article (rolled back)")
+    if args.output:
+        dump_json(args.output, {"reads": reads, "writes": writes, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Hybrid feed against join-on-read over a skewed follower graph (REPLACES follows)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--follows", type=float, default=20, help="scale of the per-user followee count (pareto distributed)")
+    parser.add_argument("--skew", type=float, default=1.1, help="zipf exponent of author popularity")
+    parser.add_argument("--fanout-max-followers", type=int, default=100)
+    parser.add_argument("--backfill", type=int, default=100)
+    parser.add_argument("--readers", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--yes", action="store_true", help="confirm replacing follows and timelines")
+    args = parser.parse_args()
+    if not args.yes:
+        parser.error("this replaces all follows and timelines; pass --yes to confirm")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
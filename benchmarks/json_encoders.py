@@ -0,0 +1,107 @@
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from benchmarks.common import dump_json, print_table
+from core.responses import dumps
+from schemas.article import ArticleListOut
+from schemas.comment import CommentListOut
+from schemas.user import AuthorOut
+
+PAGE_SIZES = (20, 100, 500)
+
+
+def _articles(n: int, body_size: int) -> ArticleListOut:
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return ArticleListOut.model_validate(
+        {
+            "articles": [
+                {
+                    "id": i,
+                    "title": f"Article {i}",
+                    "description": f"Description of article {i}",
+                    "body": "lorem ipsum " * (body_size // 12),
+                    "tag_list": ["python", "postgres", f"tag-{i % 7}"],
+                    "author_id": i % 50 + 1,
+                    "created_at": created,
+                    "comments_count": i % 13,
+                    "author": AuthorOut(id=i % 50 + 1, username=f"user-{i % 50}", bio="bio"),
+                }
+                for i in range(n)
+            ],
+            "next_cursor": "eyJ2IjpbMV19",
+        }
+    )
+
+
+def _comments(n: int) -> CommentListOut:
+    return CommentListOut.model_validate(
+        {"comments": [{"id": i, "body": f"comment {i} " * 10, "author_id": i % 50 + 1, "article_id": 1} for i in range(n)]}
+    )
+
+
+def fastapi_default(page: Any) -> bytes:
+    adapter = TypeAdapter(type(page))
+    validated = adapter.validate_python(page.model_dump(), from_attributes=True)
+    content = jsonable_encoder(adapter.dump_python(validated, mode="json"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def single_pass(page: Any) -> bytes:
+    return dumps(page)
+
+
+def orjson_wrapped(page: Any) -> bytes:
+    return dumps({"page": page})
+
+
+def measure(name: str, fn: Callable[[Any], bytes], page: Any, min_seconds: float) -> Dict[str, float]:
+    fn(page)
+    iterations = 0
+    produced = 0
+    started = time.perf_counter()
+    while True:
+        produced += len(fn(page))
+        iterations += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            break
+    return {
+        "encoder": name,
+        "ops_per_sec": round(iterations / elapsed, 1),
+        "mib_per_sec": round(produced / elapsed / 1024 / 1024, 2),
+        "us_per_page": round(elapsed / iterations * 1e6, 1),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    encoders = [
+        ("fastapi response_model + json (before)", fastapi_default),
+        ("pydantic-core, single pass (after)", single_pass),
+        ("orjson over model_dump (dict content)", orjson_wrapped),
+    ]
+    results: List[Dict[str, float]] = []
+    for size in PAGE_SIZES:
+        for kind, page in (("articles", _articles(size, args.body_size)), ("comments", _comments(size))):
+            rows = [{"page": f"{kind} x{size}", **measure(name, fn, page, args.seconds)} for name, fn in encoders]
+            print_table(rows, f"{kind}, {size} items")
+            results.extend(rows)
+    if args.output:
+        dump_json(args.output, {"results": results, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Throughput of response encoders for 20/100/500-item pages")
+    parser.add_argument("--body-size", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=1.0, help="minimum measuring time per encoder and page")
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.common import LatencyRecorder, dump_json, print_table
+
+PASSWORD = "bench-password"
+
+
+def _email(i: int) -> str:
+    return f"bench-login-{i}@example.com"
+
+
+async def register_users(client: httpx.AsyncClient, count: int) -> None:
+    for i in range(count):
+        response = await client.post(
+            "/api/users",
+            json={"email": _email(i), "username": f"bench-login-{i}", "password": PASSWORD},
+        )
+        if response.status_code not in (200, 400):
+            response.raise_for_status()
+
+
+async def _login_worker(client: httpx.AsyncClient, worker: int, users: int, deadline: float, recorder: LatencyRecorder) -> None:
+    i = worker
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.post("/api/users/login", json={"email": _email(i % users), "password": PASSWORD})
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        recorder.record(time.perf_counter() - started, ok)
+        i += 1
+
+
+async def _probe_worker(client: httpx.AsyncClient, path: str, deadline: float, recorder: LatencyRecorder) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        recorder.record(time.perf_counter() - started, ok)
+
+
+async def run_phase(base_url: str, duration: float, login_concurrency: int, probe_concurrency: int, users: int) -> List[Dict[str, float]]:
+    limits = httpx.Limits(max_connections=login_concurrency + 2 * probe_concurrency + 4)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+        logins = LatencyRecorder("POST /api/users/login")
+        articles = LatencyRecorder("GET /api/articles")
+        health = LatencyRecorder("GET /healthz")
+        tasks = [_login_worker(client, n, users, deadline, logins) for n in range(login_concurrency)]
+        tasks += [_probe_worker(client, "/api/articles?limit=20", deadline, articles) for _ in range(probe_concurrency)]
+        tasks += [_probe_worker(client, "/healthz", deadline, health) for _ in range(probe_concurrency)]
+        started = time.perf_counter()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+    rows = [articles.summary(elapsed), health.summary(elapsed)]
+    if login_concurrency:
+        rows.insert(0, logins.summary(elapsed))
+    return rows
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+        await register_users(client, args.users)
+
+    idle = await run_phase(args.base_url, args.duration, 0, args.probe_concurrency, args.users)
+    print_table(idle, "idle (probes only)")
+    storm = await run_phase(args.base_url, args.duration, args.concurrency, args.probe_concurrency, args.users)
+    print_table(storm, f"login storm (concurrency={args.concurrency})")
+
+    if args.output:
+        dump_json(args.output, {"idle": idle, "storm": storm, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Login throughput and event-loop responsiveness during a login storm")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--probe-concurrency", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
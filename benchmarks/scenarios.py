@@ -0,0 +1,310 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.common import BENCH_PASSWORD, LatencyRecorder, bench_email, compare, dump_json, load_json, print_table
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+SEARCH_TERMS = ["postgres", "async index", "cache latency", "replica", "vacuum planner", "queue worker"]
+
+
+@dataclass
+class Worker:
+    client: httpx.AsyncClient
+    rng: random.Random
+    token: str
+    admin_token: str
+    users: int
+    articles: int
+    tags: int
+    own_articles: List[int] = field(default_factory=list)
+    own_comments: List[Tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def article_id(self) -> int:
+        return min(self.articles, int(self.rng.paretovariate(1.2)))
+
+    def tag(self) -> str:
+        return f"tag-{min(self.tags, int(self.rng.paretovariate(1.1))) - 1}"
+
+
+Operation = Callable[[Worker], Awaitable[Tuple[str, httpx.Response]]]
+
+
+async def list_articles(w: Worker):
+    return "GET /api/articles", await w.client.get("/api/articles", params={"limit": 20})
+
+
+async def list_articles_offset(w: Worker):
+    return "GET /api/articles?offset", await w.client.get("/api/articles", params={"limit": 20, "offset": w.rng.randrange(0, 500, 20)})
+
+
+async def list_articles_by_tag(w: Worker):
+    return "GET /api/articles?tag", await w.client.get("/api/articles", params={"limit": 20, "tag": w.tag()})
+
+
+async def list_articles_with_authors(w: Worker):
+    return "GET /api/articles?include=author", await w.client.get("/api/articles", params={"limit": 20, "include": "author"})
+
+
+async def get_article(w: Worker):
+    return "GET /api/articles/{id}", await w.client.get(f"/api/articles/{w.article_id()}")
+
+
+async def trending_articles(w: Worker):
+    return "GET /api/articles/trending", await w.client.get("/api/articles/trending")
+
+
+async def search_articles(w: Worker):
+    return "GET /api/articles/search", await w.client.get("/api/articles/search", params={"q": w.rng.choice(SEARCH_TERMS)})
+
+
+async def list_comments(w: Worker):
+    return "GET /api/articles/{id}/comments", await w.client.get(f"/api/articles/{w.article_id()}/comments", params={"limit": 20})
+
+
+async def list_tags(w: Worker):
+    return "GET /api/tags", await w.client.get("/api/tags")
+
+
+async def current_user(w: Worker):
+    return "GET /api/user", await w.client.get("/api/user", headers=w.auth)
+
+
+async def login(w: Worker):
+    payload = {"email": bench_email(w.rng.randrange(w.users)), "password": BENCH_PASSWORD}
+    return "POST /api/users/login", await w.client.post("/api/users/login", json=payload)
+
+
+async def update_profile(w: Worker):
+    return "PUT /api/user", await w.client.put("/api/user", json={"bio": f"bio {w.rng.random()}"}, headers=w.auth)
+
+
+async def create_article(w: Worker):
+    payload = {
+        "title": f"bench {w.rng.random()}",
+        "description": "benchmark article",
+        "body": "postgres async benchmark " * 50,
+        "tag_list": [w.tag(), w.tag()],
+    }
+    response = await w.client.post("/api/articles", json=payload, headers=w.auth)
+    if response.status_code == 200:
+        w.own_articles.append(response.json()["id"])
+    return "POST /api/articles", response
+
+
+async def update_article(w: Worker):
+    if not w.own_articles:
+        return await create_article(w)
+    article_id = w.rng.choice(w.own_articles)
+    payload = {"body": "updated benchmark body " * 50, "tag_list": [w.tag()]}
+    return "PUT /api/articles/{id}", await w.client.put(f"/api/articles/{article_id}", json=payload, headers=w.auth)
+
+
+async def delete_article(w: Worker):
+    if not w.own_articles:
+        return await create_article(w)
+    article_id = w.own_articles.pop()
+    return "DELETE /api/articles/{id}", await w.client.delete(f"/api/articles/{article_id}", headers=w.auth)
+
+
+async def add_comment(w: Worker):
+    article_id = w.article_id()
+    response = await w.client.post(f"/api/articles/{article_id}/comments", json={"body": "benchmark comment"}, headers=w.auth)
+    if response.status_code == 200:
+        w.own_comments.append((article_id, response.json()["id"]))
+    return "POST /api/articles/{id}/comments", response
+
+
+async def delete_comment(w: Worker):
+    if not w.own_comments:
+        return await add_comment(w)
+    article_id, comment_id = w.own_comments.pop()
+    return "DELETE /api/articles/{id}/comments/{cid}", await w.client.delete(
+        f"/api/articles/{article_id}/comments/{comment_id}", headers=w.auth
+    )
+
+
+async def bulk_comments(w: Worker):
+    body = "".join(json.dumps({"body": "bulk benchmark comment", "article_id": w.article_id()}) + "\n" for _ in range(20))
+    return "POST /api/bulk/comments", await w.client.post("/api/bulk/comments", content=body, headers=w.auth)
+
+
+async def admin_export(w: Worker):
+    params = {"compression": "none", "after_id": w.rng.randrange(w.articles)}
+    headers = {"Authorization": f"Bearer {w.admin_token}"}
+    async with w.client.stream("GET", "/api/admin/export/articles", params=params, headers=headers) as response:
+        async for _ in response.aiter_bytes():
+            break
+    return "GET /api/admin/export/articles", response
+
+
+async def internal_stats(w: Worker):
+    return "GET /internal/cache", await w.client.get("/internal/cache")
+
+
+async def healthz(w: Worker):
+    return "GET /healthz", await w.client.get("/healthz")
+
+
+SCENARIOS: Dict[str, List[Tuple[Operation, int]]] = {
+    "read-heavy": [
+        (list_articles, 25),
+        (list_articles_offset, 5),
+        (list_articles_by_tag, 10),
+        (list_articles_with_authors, 5),
+        (get_article, 25),
+        (search_articles, 5),
+        (trending_articles, 3),
+        (list_comments, 15),
+        (list_tags, 5),
+        (current_user, 3),
+        (create_article, 1),
+        (add_comment, 1),
+    ],
+    "write-heavy": [
+        (create_article, 15),
+        (update_article, 15),
+        (delete_article, 5),
+        (add_comment, 25),
+        (delete_comment, 10),
+        (update_profile, 5),
+        (bulk_comments, 2),
+        (list_articles, 15),
+        (get_article, 8),
+    ],
+    "login-storm": [
+        (login, 80),
+        (list_articles, 10),
+        (get_article, 5),
+        (healthz, 5),
+    ],
+    "mixed": [
+        (list_articles, 20),
+        (list_articles_by_tag, 5),
+        (get_article, 20),
+        (search_articles, 5),
+        (trending_articles, 2),
+        (list_comments, 10),
+        (list_tags, 3),
+        (current_user, 3),
+        (login, 3),
+        (update_profile, 1),
+        (create_article, 3),
+        (update_article, 3),
+        (delete_article, 1),
+        (add_comment, 8),
+        (delete_comment, 2),
+        (bulk_comments, 1),
+        (internal_stats, 1),
+        (healthz, 1),
+    ],
+}
+
+
+async def _worker(w: Worker, operations: List[Operation], weights: List[int], deadline: float, recorders: Dict[str, LatencyRecorder]) -> None:
+    while time.perf_counter() < deadline:
+        operation = w.rng.choices(operations, weights=weights)[0]
+        started = time.perf_counter()
+        try:
+            name, response = await operation(w)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            name, ok = operation.__name__, False
+        recorder = recorders.setdefault(name, LatencyRecorder(name))
+        recorder.record(time.perf_counter() - started, ok)
+
+
+async def _tokens(client: httpx.AsyncClient, sessions: int) -> List[str]:
+    tokens = []
+    for i in range(sessions):
+        response = await client.post("/api/users/login", json={"email": bench_email(i), "password": BENCH_PASSWORD})
+        response.raise_for_status()
+        tokens.append(response.json()["token"]["access_token"])
+    return tokens
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, float]]:
+    mix = list(SCENARIOS[args.scenario])
+    if args.admin:
+        mix.append((admin_export, 1))
+    operations, weights = zip(*mix)
+    limits = httpx.Limits(max_connections=args.concurrency + 4)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        tokens = await _tokens(client, min(args.sessions, args.users))
+        workers = [
+            Worker(
+                client=client,
+                rng=random.Random(args.seed * 1000 + n),
+                token=tokens[n % len(tokens)],
+                admin_token=tokens[0],
+                users=args.users,
+                articles=args.articles,
+                tags=args.tags,
+            )
+            for n in range(args.concurrency)
+        ]
+        recorders: Dict[str, LatencyRecorder] = {}
+        if args.warmup:
+            await asyncio.gather(*(_worker(w, operations, weights, time.perf_counter() + args.warmup, {}) for w in workers))
+        deadline = time.perf_counter() + args.duration
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker(w, operations, weights, deadline, recorders) for w in workers))
+        elapsed = time.perf_counter() - started
+    rows = sorted((r.summary(elapsed) for r in recorders.values()), key=lambda row: -row["count"])
+    total = LatencyRecorder("TOTAL")
+    for recorder in recorders.values():
+        total.samples.extend(recorder.samples)
+        total.errors += recorder.errors
+    rows.append(total.summary(elapsed))
+    return rows
+
+
+async def main(args: argparse.Namespace) -> None:
+    rows = await run(args)
+    title = f"{args.scenario}: concurrency={args.concurrency}, duration={args.duration}s"
+    print_table(rows, title)
+
+    baseline_path = args.baseline or os.path.join(RESULTS_DIR, f"{args.scenario}.json")
+    baseline: Optional[dict] = load_json(baseline_path)
+    if baseline is not None:
+        print_table(compare(rows, baseline["results"]), f"compared with {baseline_path} ({baseline.get('recorded_at', '?')})")
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        payload = {"results": rows, "params": vars(args), "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        dump_json(os.path.join(RESULTS_DIR, f"{args.scenario}.json"), payload)
+    if args.output:
+        dump_json(args.output, {"results": rows, "params": vars(args)})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load scenarios over every API router against a datagen-seeded server")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=1000, help="must match benchmarks.datagen")
+    parser.add_argument("--articles", type=int, default=20000, help="must match benchmarks.datagen")
+    parser.add_argument("--tags", type=int, default=200, help="must match benchmarks.datagen")
+    parser.add_argument("--sessions", type=int, default=50, help="distinct logged-in users driving the load")
+    parser.add_argument("--admin", action="store_true", help="include admin export; bench-user-0 must be in ADMIN_EMAILS")
+    parser.add_argument("--baseline", default=None, help="results file to compare against (default: previous run)")
+    parser.add_argument("--no-save", action="store_true", help="do not record this run as the new baseline")
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,41 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from api.deps import get_admin_user
+from core.config import settings
+from core.database import AsyncUnitOfWork
+from repositories.export_repo import ExportRepository
+from services.export_service import ENTITIES, EXTENSIONS, MEDIA_TYPES, ExportService, make_compressor
+from models.user import User
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+async def _stream_export(entity: str, compressor, after_id: int) -> AsyncIterator[bytes]:
+    async with AsyncUnitOfWork() as session:
+        service = ExportService(ExportRepository(session), fetch_size=settings.export_fetch_size)
+        async for data in service.stream_compressed(entity, compressor, after_id=after_id):
+            yield data
+
+
+@router.get("/export/{entity}")
+async def export_entity(
+    entity: str,
+    after_id: int = Query(0, ge=0),
+    compression: str = Query("gzip", pattern="^(gzip|zstd|none)$"),
+    admin: User = Depends(get_admin_user),
+):
+    if entity not in ENTITIES:
+        raise HTTPException(status_code=404, detail="Unknown export entity")
+    try:
+        compressor = make_compressor(compression)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    filename = f"{entity}-after-{after_id}{EXTENSIONS[compression]}"
+    return StreamingResponse(
+        _stream_export(entity, compressor, after_id),
+        media_type=MEDIA_TYPES[compression],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,20 +1,44 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.deps import get_db_session, get_current_user
+from api.deps import get_db_session, get_current_user, get_read_db
+from core.config import settings
+from core.database import release_connection
+from core.responses import FastJSONRoute, dumps
+from core.response_cache import ARTICLE_LIST_TAG, article_cache, article_tag, user_tag
+from core.tracing import timed
 from repositories.article_repo import ArticleRepository
+from repositories.tag_repo import TagRepository
+from repositories.view_repo import ViewRepository
 from services.article_service import ArticleService
-from schemas.article import ArticleCreate, ArticleUpdate, ArticleOut
+from services.author_loader import AuthorLoader, wants_author
+from services.feed_service import make_feed_service
+from services.view_counter import view_counter
+from schemas.article import (
+    ArticleCreate,
+    ArticleUpdate,
+    ArticleOut,
+    ArticleWithAuthorOut,
+    ArticleListOut,
+    ArticleSearchHit,
+    ArticleSearchOut,
+    TrendingArticleOut,
+    TrendingListOut,
+)
 from models.user import User
 
-router = APIRouter(prefix="/api", tags=["articles"])
+router = APIRouter(prefix="/api", tags=["articles"], route_class=FastJSONRoute)
+
+
+def _make_service(db: AsyncSession) -> ArticleService:
+    return ArticleService(ArticleRepository(db), TagRepository(db))
 
 
 @router.post("/articles", response_model=ArticleOut)
 async def create_article(payload: ArticleCreate, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
-    service = ArticleService(ArticleRepository(db))
+    service = _make_service(db)
     article = await service.create(
         title=payload.title,
         description=payload.description,
@@ -22,28 +46,123 @@ async def create_article(payload: ArticleCreate, db: AsyncSession = Depends(get_
         tag_list=payload.tag_list,
         author_id=current_user.id,
     )
+    await make_feed_service(db).publish(article)
     return ArticleOut.model_validate(article, from_attributes=True)
 
 
-@router.get("/articles", response_model=List[ArticleOut])
-async def list_articles(limit: int = 20, offset: int = 0, db: AsyncSession = Depends(get_db_session)):
-    service = ArticleService(ArticleRepository(db))
-    items = await service.list(limit=limit, offset=offset)
-    return [ArticleOut.model_validate(a, from_attributes=True) for a in items]
+@router.get("/articles", response_model=ArticleListOut)
+async def list_articles(
+    request: Request,
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    offset: int = Query(0, ge=0, le=settings.max_list_offset),
+    cursor: Optional[str] = None,
+    tag: Optional[str] = None,
+    tags_any: Optional[List[str]] = Query(None),
+    tags_all: Optional[List[str]] = Query(None),
+    include_body: bool = True,
+    include: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    if tag:
+        tags_all = [*(tags_all or []), tag]
 
+    async def load(session: AsyncSession):
+        rows, next_cursor = await _make_service(session).list(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            tags_all=tags_all,
+            tags_any=tags_any,
+            include_body=include_body,
+        )
+        articles = rows
+        tags = [ARTICLE_LIST_TAG, *(article_tag(r.id) for r in rows)]
+        if wants_author(include):
+            authors = await AuthorLoader.for_session(session).load_many(r.author_id for r in rows)
+            articles = [{**r._mapping, "author": authors[r.author_id]} for r in rows]
+            tags.extend(user_tag(author_id) for author_id in authors)
+        await release_connection(session)
+        with timed("serialize"):
+            page = ArticleListOut.model_validate({"articles": articles, "next_cursor": next_cursor}, from_attributes=True)
+            body = dumps(page, exclude_unset=True)
+        return body, tags
 
-@router.get("/articles/{id}", response_model=ArticleOut)
-async def get_article(id: int, db: AsyncSession = Depends(get_db_session)):
-    service = ArticleService(ArticleRepository(db))
-    article = await service.get(id)
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    return ArticleOut.model_validate(article, from_attributes=True)
+    try:
+        return await article_cache.respond(request, load, db)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/articles/search", response_model=ArticleSearchOut)
+async def search_articles(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    service = _make_service(db)
+    try:
+        rows, next_cursor = await service.search(q, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    await release_connection(db)
+    return ArticleSearchOut(
+        articles=[ArticleSearchHit.model_validate(r, from_attributes=True) for r in rows],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/articles/feed", response_model=ArticleListOut, response_model_exclude_unset=True)
+async def article_feed(
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        rows, next_cursor = await make_feed_service(db).page(current_user.id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    await release_connection(db)
+    return ArticleListOut.model_validate({"articles": rows, "next_cursor": next_cursor}, from_attributes=True)
+
+
+@router.get("/articles/trending", response_model=TrendingListOut)
+async def trending_articles(limit: int = Query(20, ge=1, le=settings.max_page_size), db: AsyncSession = Depends(get_read_db)):
+    rows = await ViewRepository(db).trending(limit=limit)
+    await release_connection(db)
+    return TrendingListOut(
+        articles=[TrendingArticleOut.model_validate(r, from_attributes=True) for r in rows],
+        computed_at=rows[0].computed_at if rows else None,
+    )
+
+
+@router.get("/articles/{id}", response_model=ArticleWithAuthorOut)
+async def get_article(id: int, request: Request, include: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    async def load(session: AsyncSession):
+        article = await _make_service(session).get(id)
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        out = ArticleOut.model_validate(article, from_attributes=True)
+        tags = [article_tag(id)]
+        if wants_author(include):
+            author = await AuthorLoader.for_session(session).load(article.author_id)
+            out = ArticleWithAuthorOut(**dict(out), author=author)
+            tags.append(user_tag(article.author_id))
+        await release_connection(session)
+        with timed("serialize"):
+            body = dumps(out)
+        return body, tags
+
+    response = await article_cache.respond(request, load, db)
+    if settings.view_counting_enabled:
+        view_counter.record(id)
+    return response
 
 
 @router.put("/articles/{id}", response_model=ArticleOut)
 async def update_article(id: int, payload: ArticleUpdate, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
-    service = ArticleService(ArticleRepository(db))
+    service = _make_service(db)
     article = await service.get(id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
@@ -55,7 +174,7 @@ async def update_article(id: int, payload: ArticleUpdate, db: AsyncSession = Dep
 
 @router.delete("/articles/{id}")
 async def delete_article(id: int, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
-    service = ArticleService(ArticleRepository(db))
+    service = _make_service(db)
     article = await service.get(id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
@@ -0,0 +1,53 @@
+import io
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.deps import get_db_session, get_current_user
+from core.config import settings
+from repositories.feed_repo import FeedRepository
+from repositories.import_repo import ImportRepository
+from repositories.tag_repo import TagRepository
+from schemas.bulk import ImportReport
+from services.import_service import ImportService, read_records
+from models.user import User
+
+router = APIRouter(prefix="/api/bulk", tags=["bulk"])
+
+
+def _make_service(db: AsyncSession) -> ImportService:
+    return ImportService(ImportRepository(db), TagRepository(db), FeedRepository(db), batch_size=settings.bulk_import_batch_size)
+
+
+async def _read_lines(request: Request) -> list:
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > settings.bulk_import_max_bytes:
+            raise HTTPException(status_code=413, detail="Import payload too large")
+    try:
+        return list(io.StringIO(body.decode("utf-8"), newline="\n"))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import payload must be UTF-8")
+
+
+@router.post("/articles", response_model=ImportReport)
+async def import_articles(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+):
+    records = read_records(await _read_lines(request), format)
+    return await _make_service(db).import_articles(records, author_id=current_user.id, keep_ids=False)
+
+
+@router.post("/comments", response_model=ImportReport)
+async def import_comments(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+):
+    records = read_records(await _read_lines(request), format)
+    return await _make_service(db).import_comments(records, author_id=current_user.id, keep_ids=False)
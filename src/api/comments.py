@@ -1,34 +1,74 @@
-from typing import List
+from typing import AsyncIterator, List, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.deps import get_db_session, get_current_user
+from api.deps import get_db_session, get_current_user, get_read_db
+from core.config import settings
+from core.database import AsyncUnitOfWork, release_connection
+from core.responses import FastJSONRoute
 from repositories.article_repo import ArticleRepository
 from repositories.comment_repo import CommentRepository
+from services.author_loader import AuthorLoader, wants_author
 from services.comment_service import CommentService
-from schemas.comment import CommentCreate, CommentOut
+from schemas.comment import CommentCreate, CommentListOut, CommentOut, CommentWithAuthorOut
 from models.user import User
 
-router = APIRouter(prefix="/api", tags=["comments"])
+router = APIRouter(prefix="/api", tags=["comments"], route_class=FastJSONRoute)
+
+
+def _make_service(db: AsyncSession) -> CommentService:
+    return CommentService(CommentRepository(db), ArticleRepository(db))
+
+
+async def _with_authors(db: AsyncSession, comments: Sequence) -> List[dict]:
+    authors = await AuthorLoader.for_session(db).load_many(c.author_id for c in comments)
+    return [{**c._mapping, "author": authors[c.author_id]} for c in comments]
+
+
+async def _stream_comments(article_id: int, include_author: bool) -> AsyncIterator[str]:
+    async with AsyncUnitOfWork() as session:
+        service = _make_service(session)
+        async for rows in service.stream_for_article(article_id, batch_size=settings.comment_stream_batch_size):
+            if include_author:
+                rows = await _with_authors(session, rows)
+            yield "".join(
+                CommentWithAuthorOut.model_validate(r, from_attributes=True).model_dump_json(exclude_unset=True) + "\n" for r in rows
+            )
 
 
 @router.post("/articles/{id}/comments", response_model=CommentOut)
 async def add_comment(id: int, payload: CommentCreate, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
     if not await ArticleRepository(db).get_by_id(id):
         raise HTTPException(status_code=404, detail="Article not found")
-    service = CommentService(CommentRepository(db))
+    service = _make_service(db)
     comment = await service.add(body=payload.body, article_id=id, author_id=current_user.id)
     return CommentOut.model_validate(comment, from_attributes=True)
 
 
-@router.get("/articles/{id}/comments", response_model=List[CommentOut])
-async def list_comments(id: int, db: AsyncSession = Depends(get_db_session)):
+@router.get("/articles/{id}/comments", response_model=CommentListOut, response_model_exclude_unset=True)
+async def list_comments(
+    id: int,
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    include: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
     if not await ArticleRepository(db).get_by_id(id):
         raise HTTPException(status_code=404, detail="Article not found")
-    service = CommentService(CommentRepository(db))
-    items = await service.list_for_article(id)
-    return [CommentOut.model_validate(c, from_attributes=True) for c in items]
+    if stream:
+        await release_connection(db)
+        return StreamingResponse(_stream_comments(id, wants_author(include)), media_type="application/x-ndjson")
+    service = _make_service(db)
+    try:
+        items, next_cursor = await service.list_for_article(id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    comments = await _with_authors(db, items) if wants_author(include) else items
+    await release_connection(db)
+    return CommentListOut.model_validate({"comments": comments, "next_cursor": next_cursor}, from_attributes=True)
 
 
 @router.delete("/articles/{id}/comments/{comment_id}")
@@ -36,12 +76,10 @@ async def delete_comment(id: int, comment_id: int, db: AsyncSession = Depends(ge
     article = await ArticleRepository(db).get_by_id(id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
-    repo = CommentRepository(db)
-    comment = await repo.get_by_id(comment_id)
+    comment = await CommentRepository(db).get_by_id(comment_id)
     if not comment or comment.article_id != id:
         raise HTTPException(status_code=404, detail="Comment not found")
     if comment.author_id != current_user.id and article.author_id != current_user.id:
         raise HTTPException(status_code=403, detail="Forbidden")
-    await CommentService(repo).delete(comment)
+    await _make_service(db).delete(comment)
     return {"status": "deleted"}
-
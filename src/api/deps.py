@@ -1,10 +1,19 @@
-from fastapi import Depends, HTTPException
+import time
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from api.middleware import SAFE_METHODS, wrote_recently
+from core.cache import principal_cache, recent_writers, token_cache
+from core.config import settings
+from core.database import AsyncUnitOfWork, ReadSessionLocal, get_db
+from core.events import publish
+from core.replicas import replicas
 from core.security import decode_access_token
+from core.tracing import timed
 from models.user import User
 from repositories.user_repo import UserRepository
 
@@ -15,19 +24,71 @@ async def get_db_session(db: AsyncSession = Depends(get_db)) -> AsyncSession:
     return db
 
 
-async def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+def _bearer_user_id(request: Request) -> Optional[int]:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    user_id = token_cache.get(token)
+    if user_id is None:
+        try:
+            user_id = int(decode_access_token(token).get("sub"))
+        except (JWTError, ValueError, TypeError):
+            return None
+    return user_id
+
+
+def _reads_own_writes(request: Request) -> bool:
+    if wrote_recently(request.cookies):
+        return True
+    user_id = _bearer_user_id(request)
+    return user_id is not None and recent_writers.get(user_id) is not None
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    session_factory = None
+    if replicas and not _reads_own_writes(request):
+        session_factory = replicas.pick()
+    async with AsyncUnitOfWork(session_factory or ReadSessionLocal) as session:
+        yield session
+
+
+async def _authenticate(creds: HTTPAuthorizationCredentials, db: AsyncSession) -> User:
     token = creds.credentials
-    try:
-        payload = decode_access_token(token)
-        user_id = int(payload.get("sub"))
-    except (JWTError, ValueError):
-        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = decode_access_token(token)
+            user_id = int(payload.get("sub"))
+        except (JWTError, ValueError, TypeError):
+            raise HTTPException(status_code=401, detail="Invalid token")
+        token_cache.set(token, user_id, ttl=payload["exp"] - time.time())
+
+    repo = UserRepository(db)
+    row = principal_cache.get(user_id)
+    if row is not None:
+        return await repo.attach(row)
 
-    user = await UserRepository(db).get_by_id(user_id)
+    user = await repo.get_by_id(user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
+    principal_cache.set(user_id, repo.snapshot(user))
+    return user
+
+
+async def get_current_user(
+    request: Request,
+    creds: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    with timed("auth"):
+        user = await _authenticate(creds, db)
+    if replicas and settings.read_your_writes_seconds > 0 and request.method not in SAFE_METHODS:
+        # bearer clients keep no cookie, so pin this user's reads to the primary on every worker
+        await publish(db, "user_write", user.id)
     return user
 
+
+async def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
+    if current_user.email not in settings.admin_emails:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return current_user
@@ -0,0 +1,37 @@
+from fastapi import APIRouter
+
+from core.admission import admission
+from core.cache import principal_cache, token_cache
+from core.database import get_engine
+from core.events import invalidation_listener
+from core.pool import pool_stats
+from core.replicas import replicas
+from core.response_cache import article_cache
+from services.view_counter import trending_refresher, view_counter
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/cache")
+def cache_stats():
+    return {
+        "articles": article_cache.stats(),
+        "principals": principal_cache.stats(),
+        "tokens": token_cache.stats(),
+        "invalidation_bus": invalidation_listener.stats(),
+    }
+
+
+@router.get("/pool")
+def pool_status():
+    return {"primary": pool_stats(get_engine()), "replicas": replicas.stats()}
+
+
+@router.get("/admission")
+def admission_status():
+    return admission.stats()
+
+
+@router.get("/views")
+def view_stats():
+    return {**view_counter.stats(), "trending_refreshed_at": trending_refresher.last_refresh}
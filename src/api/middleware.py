@@ -0,0 +1,63 @@
+import json
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.admission import AdmissionController, Overloaded
+
+READ_YOUR_WRITES_COOKIE = "rw_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or self.window <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.window
+                cookie = f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; Max-Age={int(self.window) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                message.setdefault("headers", []).append((b"set-cookie", cookie.encode("latin-1")))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def wrote_recently(cookies: dict) -> bool:
+    try:
+        return float(cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class AdmissionMiddleware:
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = self.controller.limiter_for(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            async with limiter.slot():
+                await self.app(scope, receive, send)
+        except Overloaded as exc:
+            await self._reject(exc, send)
+
+    async def _reject(self, exc: Overloaded, send: Send) -> None:
+        body = json.dumps({"detail": str(exc)}).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(exc.limiter.retry_after).encode()),
+        ]
+        await send({"type": "http.response.start", "status": exc.limiter.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.deps import get_read_db
+from core.config import settings
+from core.database import release_connection
+from core.responses import FastJSONRoute
+from repositories.tag_repo import TagRepository
+from schemas.tag import TagListOut, TagOut
+
+router = APIRouter(prefix="/api", tags=["tags"], route_class=FastJSONRoute)
+
+
+@router.get("/tags", response_model=TagListOut)
+async def list_tags(limit: int = Query(20, ge=1, le=settings.max_page_size), db: AsyncSession = Depends(get_read_db)):
+    items = await TagRepository(db).popular(limit=limit)
+    await release_connection(db)
+    return TagListOut(tags=[TagOut(tag=t.tag, count=t.articles_count) for t in items])
@@ -1,25 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.deps import get_db_session, get_current_user
+from core.config import settings
+from core.database import AsyncUnitOfWork
+from core.responses import FastJSONRoute
 from core.security import create_access_token
+from repositories.article_repo import ArticleRepository
+from repositories.comment_repo import CommentRepository
+from repositories.follow_repo import FollowRepository
+from repositories.tag_repo import TagRepository
 from repositories.user_repo import UserRepository
 from schemas.auth import TokenOut
-from schemas.user import UserCreate, UserLogin, UserOut, UserUpdate
+from schemas.user import FollowOut, UserCreate, UserLogin, UserOut, UserUpdate
+from services.feed_service import make_feed_service
+from services.purge_service import UserPurgeService
 from services.user_service import UserService
 from models.user import User
 
-router = APIRouter(prefix="/api", tags=["users"])
+router = APIRouter(prefix="/api", tags=["users"], route_class=FastJSONRoute)
 
 
 def _make_service(db: AsyncSession) -> UserService:
     return UserService(UserRepository(db))
 
 
+async def _purge_user(user_id: int) -> None:
+    async with AsyncUnitOfWork() as session:
+        service = UserPurgeService(
+            UserRepository(session),
+            ArticleRepository(session),
+            CommentRepository(session),
+            TagRepository(session),
+            FollowRepository(session),
+            batch_size=settings.purge_batch_size,
+        )
+        await service.purge(user_id)
+
+
 def _build_response(user: User) -> dict:
     token = create_access_token(str(user.id))
     return {
-        "user": UserOut.model_validate(user.__dict__, from_attributes=True),
+        "user": UserOut.model_validate(user, from_attributes=True),
         "token": TokenOut(access_token=token),
     }
 
@@ -49,7 +71,7 @@ async def login_user(payload: UserLogin, db: AsyncSession = Depends(get_db_sessi
         raise HTTPException(status_code=400, detail=str(exc))
     user = await UserRepository(db).get_by_email(payload.email)
     return {
-        "user": UserOut.model_validate(user.__dict__, from_attributes=True),
+        "user": UserOut.model_validate(user, from_attributes=True),
         "token": TokenOut(access_token=token),
     }
 
@@ -75,3 +97,33 @@ async def update_user(
         image_url=payload.image_url,
     )
     return _build_response(user)
+
+
+@router.delete("/user", status_code=202)
+async def delete_user(background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
+    background_tasks.add_task(_purge_user, current_user.id)
+    return {"status": "scheduled"}
+
+
+async def _get_followee(id: int, db: AsyncSession) -> User:
+    followee = await UserRepository(db).get_by_id(id)
+    if not followee:
+        raise HTTPException(status_code=404, detail="User not found")
+    return followee
+
+
+@router.post("/users/{id}/follow", response_model=FollowOut)
+async def follow_user(id: int, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
+    await _get_followee(id, db)
+    try:
+        followers = await make_feed_service(db).follow(current_user.id, id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return FollowOut(user_id=id, following=True, followers_count=followers)
+
+
+@router.delete("/users/{id}/follow", response_model=FollowOut)
+async def unfollow_user(id: int, db: AsyncSession = Depends(get_db_session), current_user: User = Depends(get_current_user)):
+    await _get_followee(id, db)
+    followers = await make_feed_service(db).unfollow(current_user.id, id)
+    return FollowOut(user_id=id, following=False, followers_count=followers)
@@ -0,0 +1,19 @@
+import argparse
+import asyncio
+
+from cli import export_content, import_content, purge_user, reconcile_counts
+
+COMMANDS = [import_content, export_content, reconcile_counts, purge_user]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in COMMANDS:
+        command.register(subparsers)
+    args = parser.parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
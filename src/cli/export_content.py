@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+from core.config import settings
+from core.database import AsyncUnitOfWork, dispose_engine, init_engine
+from repositories.export_repo import ExportRepository
+from services.export_service import COMPRESSIONS, ENTITIES, EXTENSIONS, ExportService, make_compressor
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("export", help="dump articles, comments and users as compressed NDJSON chunks")
+    parser.add_argument("entities", nargs="*", choices=ENTITIES, default=list(ENTITIES))
+    parser.add_argument("--out-dir", default="export")
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="gzip")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000, help="rows per output file")
+    parser.add_argument("--fetch-size", type=int, default=settings.export_fetch_size)
+    parser.add_argument("--after-id", type=int, default=None, help="start after this id instead of the saved checkpoint")
+    parser.add_argument("--with-secrets", action="store_true", help="include users.password_hash")
+    parser.set_defaults(handler=run)
+
+
+class _Checkpoint:
+    def __init__(self, out_dir: str, entity: str) -> None:
+        self.path = os.path.join(out_dir, f"{entity}.checkpoint.json")
+        self.last_id = 0
+        self.chunk = 0
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+            self.last_id, self.chunk = state["last_id"], state["chunk"]
+
+    def save(self, last_id: int, chunk: int) -> None:
+        self.last_id, self.chunk = last_id, chunk
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"last_id": last_id, "chunk": chunk}, f)
+        os.replace(tmp, self.path)
+
+
+async def _export_entity(args: argparse.Namespace, entity: str) -> None:
+    checkpoint = _Checkpoint(args.out_dir, entity)
+    if args.after_id is not None:
+        checkpoint.last_id = args.after_id
+    started = time.perf_counter()
+    exported = 0
+    chunk = checkpoint.chunk
+    output = None
+    compressor = None
+    rows_in_chunk = 0
+    last_id: Optional[int] = None
+
+    def close_chunk() -> None:
+        nonlocal output, compressor
+        output.write(compressor.flush())
+        output.close()
+        checkpoint.save(last_id, chunk)
+        output = compressor = None
+
+    async with AsyncUnitOfWork() as session:
+        service = ExportService(ExportRepository(session), fetch_size=args.fetch_size)
+        async for last_id, count, data in service.stream(entity, after_id=checkpoint.last_id, include_secrets=args.with_secrets):
+            if output is None:
+                chunk += 1
+                rows_in_chunk = 0
+                compressor = make_compressor(args.compression)
+                output = open(os.path.join(args.out_dir, f"{entity}-{chunk:06d}{EXTENSIONS[args.compression]}"), "wb")
+            output.write(compressor.compress(data))
+            rows_in_chunk += count
+            exported += count
+            if rows_in_chunk >= args.chunk_rows:
+                close_chunk()
+            rate = exported / max(time.perf_counter() - started, 1e-9)
+            sys.stderr.write(f"\r{entity}: {exported} rows exported (last id {last_id}), {rate:,.0f} rows/s")
+            sys.stderr.flush()
+        if output is not None:
+            close_chunk()
+    sys.stderr.write("\n")
+    print(f"{entity}: {exported} rows exported in {time.perf_counter() - started:.1f}s")
+
+
+async def run(args: argparse.Namespace) -> None:
+    make_compressor(args.compression)
+    os.makedirs(args.out_dir, exist_ok=True)
+    init_engine()
+    try:
+        for entity in args.entities:
+            await _export_entity(args, entity)
+    finally:
+        await dispose_engine()
@@ -0,0 +1,63 @@
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+from core.config import settings
+from core.database import AsyncUnitOfWork, dispose_engine, init_engine
+from repositories.feed_repo import FeedRepository
+from repositories.import_repo import ImportRepository
+from repositories.tag_repo import TagRepository
+from schemas.bulk import ImportReport
+from services.import_service import ImportService, read_records
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("import", help="bulk-load articles or comments from NDJSON/CSV through COPY")
+    parser.add_argument("entity", choices=["articles", "comments"])
+    parser.add_argument("path", help="input file, or - for stdin")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default=None, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=settings.bulk_import_batch_size)
+    parser.set_defaults(handler=run)
+
+
+@contextmanager
+def _open(path: str) -> Iterator[TextIO]:
+    if path == "-":
+        yield sys.stdin
+    else:
+        with open(path, encoding="utf-8", newline="") as f:
+            yield f
+
+
+async def run(args: argparse.Namespace) -> None:
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    started = time.perf_counter()
+
+    def progress(report: ImportReport) -> None:
+        rate = report.received / max(time.perf_counter() - started, 1e-9)
+        sys.stderr.write(
+            f"\r{args.entity}: {report.received} read, {report.imported} imported, "
+            f"{report.rejected} rejected, {rate:,.0f} rows/s"
+        )
+        sys.stderr.flush()
+
+    init_engine()
+    try:
+        with _open(args.path) as lines:
+            async with AsyncUnitOfWork() as session:
+                service = ImportService(ImportRepository(session), TagRepository(session), FeedRepository(session), args.batch_size, progress)
+                records = read_records(lines, fmt)
+                if args.entity == "articles":
+                    report = await service.import_articles(records)
+                else:
+                    report = await service.import_comments(records)
+    finally:
+        await dispose_engine()
+
+    elapsed = time.perf_counter() - started
+    sys.stderr.write("\n")
+    print(f"{report.imported} {args.entity} imported, {report.rejected} rejected in {elapsed:.1f}s")
+    for error in report.errors:
+        print(f"  {error}")
@@ -0,0 +1,44 @@
+import argparse
+import sys
+
+from core.config import settings
+from core.database import AsyncUnitOfWork, dispose_engine, init_engine
+from repositories.article_repo import ArticleRepository
+from repositories.comment_repo import CommentRepository
+from repositories.follow_repo import FollowRepository
+from repositories.tag_repo import TagRepository
+from repositories.user_repo import UserRepository
+from services.purge_service import UserPurgeService
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("purge-user", help="delete a user with all their articles and comments in batches")
+    parser.add_argument("user_id", type=int)
+    parser.add_argument("--batch-size", type=int, default=settings.purge_batch_size, help="rows per transaction")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    def progress(stage: str, deleted: int) -> None:
+        sys.stderr.write(f"\r{stage}: {deleted} deleted")
+        sys.stderr.flush()
+
+    init_engine()
+    try:
+        async with AsyncUnitOfWork() as session:
+            service = UserPurgeService(
+                UserRepository(session),
+                ArticleRepository(session),
+                CommentRepository(session),
+                TagRepository(session),
+                FollowRepository(session),
+                batch_size=args.batch_size,
+                progress=progress,
+            )
+            report = await service.purge(args.user_id)
+    finally:
+        await dispose_engine()
+    sys.stderr.write("\n")
+    if not report["users"]:
+        print(f"user {args.user_id} not found")
+    print(f"{report['articles']} articles and {report['comments']} comments deleted")
@@ -0,0 +1,29 @@
+import argparse
+import sys
+
+from core.database import AsyncUnitOfWork, dispose_engine, init_engine
+from repositories.article_repo import ArticleRepository
+from repositories.comment_repo import CommentRepository
+from services.comment_service import CommentService
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("reconcile-comment-counts", help="recompute articles.comments_count and fix drift")
+    parser.add_argument("--batch-size", type=int, default=5000, help="articles per transaction")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    def progress(last_id: int, fixed: int) -> None:
+        sys.stderr.write(f"\rchecked up to article {last_id}, {fixed} fixed")
+        sys.stderr.flush()
+
+    init_engine()
+    try:
+        async with AsyncUnitOfWork() as session:
+            service = CommentService(CommentRepository(session), ArticleRepository(session))
+            fixed = await service.reconcile_counts(batch_size=args.batch_size, progress=progress)
+    finally:
+        await dispose_engine()
+    sys.stderr.write("\n")
+    print(f"{fixed} articles had a drifted comments_count")
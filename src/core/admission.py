@@ -0,0 +1,122 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from core.config import settings
+from core.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTED, ADMISSION_WAIT
+
+AUTH_ROUTES = frozenset({("POST", "/api/users"), ("POST", "/api/users/login")})
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+class Overloaded(Exception):
+    def __init__(self, limiter: "Limiter", reason: str) -> None:
+        super().__init__(f"{limiter.name} requests are over capacity ({reason})")
+        self.limiter = limiter
+        self.reason = reason
+
+
+class Limiter:
+    def __init__(self, name: str, concurrency: int, max_queue: int, queue_timeout: float, status_code: int) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.status_code = status_code
+        self.retry_after = max(1, math.ceil(queue_timeout))
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "timeout": 0}
+
+    def _reject(self, reason: str) -> Overloaded:
+        self.rejected[reason] += 1
+        ADMISSION_REJECTED.labels(self.name, reason).inc()
+        return Overloaded(self, reason)
+
+    async def _acquire(self) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+        if self.waiting >= self.max_queue:
+            raise self._reject("queue_full")
+        self.waiting += 1
+        ADMISSION_QUEUE_DEPTH.labels(self.name).inc()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("timeout")
+        finally:
+            self.waiting -= 1
+            ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+            ADMISSION_WAIT.labels(self.name).observe(time.perf_counter() - started)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self._acquire()
+        self.active += 1
+        self.admitted += 1
+        in_flight = ADMISSION_IN_FLIGHT.labels(self.name)
+        in_flight.inc()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            in_flight.dec()
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "concurrency": self.concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+        }
+
+
+class AdmissionController:
+    def __init__(self, auth: Limiter, reads: Limiter, writes: Limiter) -> None:
+        self.auth = auth
+        self.reads = reads
+        self.writes = writes
+
+    def limiter_for(self, method: str, path: str) -> Optional[Limiter]:
+        if not path.startswith("/api/"):
+            return None
+        if (method, path.rstrip("/")) in AUTH_ROUTES:
+            return self.auth
+        return self.reads if method in READ_METHODS else self.writes
+
+    def stats(self) -> Dict[str, object]:
+        return {limiter.name: limiter.stats() for limiter in (self.auth, self.reads, self.writes)}
+
+
+admission = AdmissionController(
+    auth=Limiter(
+        "auth",
+        concurrency=settings.admission_auth_concurrency,
+        max_queue=settings.admission_auth_queue,
+        queue_timeout=settings.admission_auth_timeout_seconds,
+        status_code=429,
+    ),
+    reads=Limiter(
+        "reads",
+        concurrency=settings.admission_read_concurrency,
+        max_queue=settings.admission_read_queue,
+        queue_timeout=settings.admission_read_timeout_seconds,
+        status_code=503,
+    ),
+    writes=Limiter(
+        "writes",
+        concurrency=settings.admission_write_concurrency,
+        max_queue=settings.admission_write_queue,
+        queue_timeout=settings.admission_write_timeout_seconds,
+        status_code=503,
+    ),
+)
@@ -1,4 +1,5 @@
 import os
+from typing import List
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -13,16 +14,105 @@ class Settings(BaseModel):
     postgres_user: str = os.getenv("POSTGRES_USER", "postgres")
     postgres_password: str = os.getenv("POSTGRES_PASSWORD", "postgres")
 
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_recycle_seconds: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    db_pool_timeout_seconds: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "5"))
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    db_statement_timeout_ms: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+    db_pgbouncer: bool = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+    replica_hosts: List[str] = [h.strip() for h in os.getenv("REPLICA_HOSTS", "").split(",") if h.strip()]
+    replica_max_lag_seconds: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+    replica_lag_check_seconds: float = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "2"))
+    read_your_writes_seconds: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
     secret_key: str = os.getenv("SECRET_KEY", "change_me")
     algorithm: str = os.getenv("ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    admin_emails: List[str] = [e.strip() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()]
 
-    @property
-    def database_url(self) -> str:
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    password_hash_executor: str = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    password_hash_max_queue: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+    password_hash_timeout_seconds: float = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "5"))
+
+    principal_cache_ttl_seconds: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    principal_cache_size: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+    token_cache_size: int = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+    max_page_size: int = int(os.getenv("MAX_PAGE_SIZE", "100"))
+    max_list_offset: int = int(os.getenv("MAX_LIST_OFFSET", "1000"))
+
+    search_language: str = os.getenv("SEARCH_LANGUAGE", "english")
+    comment_stream_batch_size: int = int(os.getenv("COMMENT_STREAM_BATCH_SIZE", "500"))
+
+    article_cache_size: int = int(os.getenv("ARTICLE_CACHE_SIZE", "2048"))
+    article_cache_ttl_seconds: float = float(os.getenv("ARTICLE_CACHE_TTL_SECONDS", "30"))
+    article_cache_stale_seconds: float = float(os.getenv("ARTICLE_CACHE_STALE_SECONDS", "30"))
+    article_cache_client_max_age: int = int(os.getenv("ARTICLE_CACHE_CLIENT_MAX_AGE", "0"))
+
+    invalidation_bus_enabled: bool = os.getenv("INVALIDATION_BUS_ENABLED", "true").lower() == "true"
+    invalidation_channel: str = os.getenv("INVALIDATION_CHANNEL", "savin_invalidation")
+
+    bulk_import_batch_size: int = int(os.getenv("BULK_IMPORT_BATCH_SIZE", "5000"))
+    bulk_import_max_bytes: int = int(os.getenv("BULK_IMPORT_MAX_BYTES", str(50 * 1024 * 1024)))
+    export_fetch_size: int = int(os.getenv("EXPORT_FETCH_SIZE", "1000"))
+    purge_batch_size: int = int(os.getenv("PURGE_BATCH_SIZE", "5000"))
+
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    event_loop_lag_interval_seconds: float = float(os.getenv("EVENT_LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+
+    query_tracing_enabled: bool = os.getenv("QUERY_TRACING_ENABLED", "true").lower() == "true"
+    server_timing_enabled: bool = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+    slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+    n_plus_one_threshold: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+    feed_fanout_max_followers: int = int(os.getenv("FEED_FANOUT_MAX_FOLLOWERS", "1000"))
+    feed_backfill_size: int = int(os.getenv("FEED_BACKFILL_SIZE", "100"))
+
+    view_counting_enabled: bool = os.getenv("VIEW_COUNTING_ENABLED", "true").lower() == "true"
+    view_flush_interval_seconds: float = float(os.getenv("VIEW_FLUSH_INTERVAL_SECONDS", "5"))
+    view_buffer_max_articles: int = int(os.getenv("VIEW_BUFFER_MAX_ARTICLES", "10000"))
+    view_bucket_seconds: int = int(os.getenv("VIEW_BUCKET_SECONDS", "600"))
+    trending_refresh_seconds: float = float(os.getenv("TRENDING_REFRESH_SECONDS", "60"))
+    trending_half_life_hours: float = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "6"))
+    trending_window_hours: float = float(os.getenv("TRENDING_WINDOW_HOURS", "48"))
+    trending_size: int = int(os.getenv("TRENDING_SIZE", "100"))
+
+    admission_enabled: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    admission_auth_concurrency: int = int(os.getenv("ADMISSION_AUTH_CONCURRENCY", "8"))
+    admission_auth_queue: int = int(os.getenv("ADMISSION_AUTH_QUEUE", "32"))
+    admission_auth_timeout_seconds: float = float(os.getenv("ADMISSION_AUTH_TIMEOUT_SECONDS", "1"))
+    admission_read_concurrency: int = int(os.getenv("ADMISSION_READ_CONCURRENCY", "64"))
+    admission_read_queue: int = int(os.getenv("ADMISSION_READ_QUEUE", "256"))
+    admission_read_timeout_seconds: float = float(os.getenv("ADMISSION_READ_TIMEOUT_SECONDS", "2"))
+    admission_write_concurrency: int = int(os.getenv("ADMISSION_WRITE_CONCURRENCY", "16"))
+    admission_write_queue: int = int(os.getenv("ADMISSION_WRITE_QUEUE", "64"))
+    admission_write_timeout_seconds: float = float(os.getenv("ADMISSION_WRITE_TIMEOUT_SECONDS", "2"))
+
+    host: str = os.getenv("HOST", "0.0.0.0")
+    port: int = int(os.getenv("PORT", "8000"))
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    graceful_shutdown_seconds: float = float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "20"))
+    drain_delay_seconds: float = float(os.getenv("DRAIN_DELAY_SECONDS", "5"))
+    warmup_connections: int = int(os.getenv("WARMUP_CONNECTIONS", "5"))
+
+    def _url(self, host: str, port: str) -> str:
         return (
             "postgresql+asyncpg://"
             f"{self.postgres_user}:{self.postgres_password}"
-            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+            f"@{host}:{port}/{self.postgres_db}"
         )
 
-settings = Settings()
\ No newline at end of file
+    @property
+    def database_url(self) -> str:
+        return self._url(self.postgres_host, self.postgres_port)
+
+    @property
+    def replica_urls(self) -> List[str]:
+        return [self._url(*(h.rsplit(":", 1) if ":" in h else (h, self.postgres_port))) for h in self.replica_hosts]
+
+settings = Settings()
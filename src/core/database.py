@@ -1,22 +1,81 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import uuid
+from typing import Optional, Type
+
+import asyncpg
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from types import TracebackType
 
 from core.config import settings
+from core.pool import InstrumentedPool, PoolStats
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
-AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+def _connect_args() -> dict:
+    if settings.db_pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    connect_args = {"statement_cache_size": settings.db_statement_cache_size}
+    if settings.db_statement_timeout_ms:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    return connect_args
+
+
+def make_engine(url: str, name: str = "primary") -> AsyncEngine:
+    cache_size = 0 if settings.db_pgbouncer else settings.db_statement_cache_size
+    engine = create_async_engine(
+        make_url(url).update_query_dict({"prepared_statement_cache_size": str(cache_size)}),
+        poolclass=InstrumentedPool.bound_to(PoolStats(name)),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=_connect_args(),
+    )
+    return engine
+
+
+def read_bind(engine: AsyncEngine) -> AsyncEngine:
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+engine: Optional[AsyncEngine] = None
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False, autoflush=False)
+ReadSessionLocal = async_sessionmaker(expire_on_commit=False, autoflush=False)
+
+
+def init_engine() -> AsyncEngine:
+    global engine
+    if engine is None:
+        engine = make_engine(settings.database_url)
+        AsyncSessionLocal.configure(bind=engine)
+        ReadSessionLocal.configure(bind=read_bind(engine))
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    if engine is None:
+        raise RuntimeError("database engine is not initialised, call init_engine() first")
+    return engine
+
+
+async def dispose_engine() -> None:
+    global engine
+    if engine is not None:
+        await engine.dispose()
+        engine = None
 
-from typing import Optional, Type
 
 class AsyncUnitOfWork:
-    def __init__(self) -> None:
-        self.session: AsyncSession = AsyncSessionLocal()
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal) -> None:
+        self.session: AsyncSession = session_factory()
 
     async def __aenter__(self) -> AsyncSession:
         return self.session
@@ -37,3 +96,18 @@ class AsyncUnitOfWork:
 async def get_db():
     async with AsyncUnitOfWork() as session:
         yield session
+
+
+async def release_connection(session: AsyncSession) -> None:
+    if session.in_transaction():
+        await session.commit()
+
+
+async def connect_raw() -> asyncpg.Connection:
+    return await asyncpg.connect(
+        host=settings.postgres_host,
+        port=int(settings.postgres_port),
+        user=settings.postgres_user,
+        password=settings.postgres_password,
+        database=settings.postgres_db,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import connect_raw
+
+logger = logging.getLogger(__name__)
+
+WORKER_ID = uuid.uuid4().hex
+RESET = "*"
+# keeps a NOTIFY payload of ids well under the 8000 byte limit
+IDS_PER_EVENT = 400
+
+Handler = Callable[[dict], None]
+
+_handlers: Dict[str, List[Handler]] = {}
+
+
+def subscribe(entity: str, handler: Handler) -> None:
+    _handlers.setdefault(entity, []).append(handler)
+
+
+def dispatch(message: dict) -> None:
+    for handler in _handlers.get(message.get("entity"), ()):
+        try:
+            handler(message)
+        except Exception:
+            logger.exception("invalidation handler failed for %s", message)
+
+
+async def publish(db: AsyncSession, entity: str, entity_id: Optional[int] = None, **fields) -> None:
+    message = {"entity": entity, "id": entity_id, **fields}
+    dispatch(message)
+    db.info.setdefault("pending_events", []).append(message)
+    payload = json.dumps({**message, "origin": WORKER_ID}, separators=(",", ":"))
+    await db.execute(select(func.pg_notify(settings.invalidation_channel, payload)))
+
+
+def chunked(ids: Sequence[int]) -> Iterator[List[int]]:
+    for start in range(0, len(ids), IDS_PER_EVENT):
+        yield list(ids[start:start + IDS_PER_EVENT])
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_committed(session: Session) -> None:
+    for message in session.info.pop("pending_events", ()):
+        dispatch(message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop("pending_events", None)
+
+
+class InvalidationListener:
+    def __init__(self, channel: str, keepalive: float = 15.0, max_backoff: float = 30.0) -> None:
+        self.channel = channel
+        self.keepalive = keepalive
+        self.max_backoff = max_backoff
+        self.connected = False
+        self._subscribed = False
+        self.received = 0
+        self.reconnects = 0
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("ignoring malformed invalidation payload %r", payload)
+            return
+        self.received += 1
+        if message.pop("origin", None) != WORKER_ID:
+            dispatch(message)
+
+    async def _listen_once(self) -> None:
+        connection = await connect_raw()
+        try:
+            await connection.add_listener(self.channel, self._on_notify)
+            self.connected = self._subscribed = True
+            dispatch({"entity": RESET})
+            while not connection.is_closed():
+                await asyncio.sleep(self.keepalive)
+                await asyncio.wait_for(connection.fetchval("SELECT 1"), timeout=self.keepalive)
+        finally:
+            self.connected = False
+            if not connection.is_closed():
+                connection.terminate()
+
+    async def run(self) -> None:
+        backoff = 0.5
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("invalidation listener disconnected, retrying in %.1fs", backoff, exc_info=True)
+            if self._subscribed:
+                self._subscribed = False
+                backoff = 0.5
+            self.reconnects += 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def stats(self) -> Dict[str, float]:
+        return {"connected": self.connected, "received": self.received, "reconnects": self.reconnects}
+
+
+invalidation_listener = InvalidationListener(settings.invalidation_channel)
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.security import password_hasher
+
+logger = logging.getLogger(__name__)
+
+
+class Lifecycle:
+    def __init__(self) -> None:
+        self.ready = False
+        self.draining = False
+
+    @property
+    def accepting(self) -> bool:
+        return self.ready and not self.draining
+
+
+lifecycle = Lifecycle()
+
+
+async def _open_connection(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    started = time.perf_counter()
+    connections = min(connections, engine.pool.size())
+    results = await asyncio.gather(
+        *(_open_connection(engine) for _ in range(connections)),
+        password_hasher.warm_up(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("warm-up step failed: %r", result)
+    logger.info("worker warmed up in %.2fs (%d connections)", time.perf_counter() - started, connections)
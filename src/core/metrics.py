@@ -0,0 +1,100 @@
+import asyncio
+import os
+import time
+from typing import Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.tracing import request_queries
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests", ["method", "route", "status"])
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency", ["method", "route"], buckets=LATENCY_BUCKETS)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served", ["method"], multiprocess_mode="livesum")
+
+DB_QUERY_LATENCY = Histogram("db_query_duration_seconds", "Database statement latency", ["route"], buckets=QUERY_BUCKETS)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request", "Database statements per HTTP request", ["route"], buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+)
+DB_POOL_WAIT = Histogram("db_pool_checkout_wait_seconds", "Time waiting for a pooled connection", ["pool"], buckets=QUERY_BUCKETS)
+DB_POOL_TIMEOUTS = Counter("db_pool_checkout_timeouts_total", "Pool checkouts that timed out", ["pool"])
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out", ["pool"], multiprocess_mode="livesum")
+
+PASSWORD_HASH_LATENCY = Histogram(
+    "password_hash_duration_seconds", "bcrypt hash/verify latency including queueing", ["operation"], buckets=LATENCY_BUCKETS
+)
+PASSWORD_HASH_PENDING = Gauge("password_hash_pending", "bcrypt jobs queued or running", multiprocess_mode="livesum")
+
+ADMISSION_IN_FLIGHT = Gauge("admission_in_flight", "Requests admitted and running", ["limiter"], multiprocess_mode="livesum")
+ADMISSION_QUEUE_DEPTH = Gauge("admission_queue_depth", "Requests waiting for admission", ["limiter"], multiprocess_mode="livesum")
+ADMISSION_WAIT = Histogram("admission_wait_seconds", "Time queued before admission", ["limiter"], buckets=LATENCY_BUCKETS)
+ADMISSION_REJECTED = Counter("admission_rejected_total", "Requests shed by admission control", ["limiter", "reason"])
+
+EVENT_LOOP_LAG = Histogram("event_loop_lag_seconds", "Extra delay of a scheduled event loop wakeup", buckets=QUERY_BUCKETS)
+
+
+def route_of(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        with request_queries(scope) as recorder:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                in_flight.dec()
+                route = route_of(scope)
+                HTTP_LATENCY.labels(method, route).observe(elapsed)
+                HTTP_REQUESTS.labels(method, route, str(status)).inc()
+                DB_QUERIES_PER_REQUEST.labels(route).observe(recorder.count)
+                query_latency = DB_QUERY_LATENCY.labels(route)
+                for _, duration in recorder.queries:
+                    query_latency.observe(duration)
+
+
+def observe_background_query(duration: float) -> None:
+    DB_QUERY_LATENCY.labels("background").observe(duration)
+
+
+async def sample_event_loop_lag(interval: float) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - scheduled - interval))
+
+
+def render() -> Tuple[bytes, str]:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
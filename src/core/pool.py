@@ -0,0 +1,78 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_TIMEOUTS, DB_POOL_WAIT
+
+
+class PoolStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        DB_POOL_WAIT.labels(self.name).observe(waited)
+        if timed_out:
+            DB_POOL_TIMEOUTS.labels(self.name).inc()
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> Dict[str, float]:
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms_total": round(self.wait_seconds_total * 1000, 2),
+            "wait_ms_avg": round(self.wait_seconds_total / attempts * 1000, 3) if attempts else 0.0,
+            "wait_ms_max": round(self.wait_seconds_max * 1000, 2),
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    stats: PoolStats
+
+    @classmethod
+    def bound_to(cls, stats: PoolStats) -> type:
+        return type(cls.__name__, (cls,), {"stats": stats})
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started, timed_out=False)
+        DB_POOL_CHECKED_OUT.labels(self.stats.name).inc()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        DB_POOL_CHECKED_OUT.labels(self.stats.name).dec()
+        super()._do_return_conn(record)
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, float]:
+    pool = engine.pool
+    data = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        data.update(stats.snapshot())
+    return data
@@ -0,0 +1,107 @@
+import asyncio
+import itertools
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.database import make_engine, read_bind
+from core.pool import pool_stats
+
+logger = logging.getLogger(__name__)
+
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class Replica:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine: Optional[AsyncEngine] = None
+        self.sessionmaker = async_sessionmaker(expire_on_commit=False, autoflush=False, info={"replica": True})
+        self.lag: Optional[float] = None
+
+    def start(self) -> None:
+        if self.engine is None:
+            self.engine = make_engine(self.url, name=make_url(self.url).host or "replica")
+            self.sessionmaker.configure(bind=read_bind(self.engine))
+
+    async def dispose(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+            self.lag = None
+
+    async def check_lag(self) -> None:
+        try:
+            async with self.engine.connect() as connection:
+                lag = (await connection.execute(LAG_QUERY)).scalar()
+        except Exception:
+            logger.warning("replica %s is unreachable", self.name, exc_info=True)
+            lag = None
+        self.lag = None if lag is None else float(lag)
+
+
+class ReplicaSet:
+    def __init__(self, urls: List[str], max_lag: float, check_interval: float) -> None:
+        self.replicas = [Replica(url) for url in urls]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._counter = itertools.count()
+        self.routed = 0
+        self.fallbacks = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def _healthy(self) -> List[Replica]:
+        return [r for r in self.replicas if r.lag is not None and r.lag <= self.max_lag]
+
+    def pick(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        healthy = self._healthy()
+        if not healthy:
+            self.fallbacks += 1
+            return None
+        self.routed += 1
+        return healthy[next(self._counter) % len(healthy)].sessionmaker
+
+    def start(self) -> None:
+        for replica in self.replicas:
+            replica.start()
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.gather(*(replica.check_lag() for replica in self.replicas))
+            await asyncio.sleep(self.check_interval)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "routed": self.routed,
+            "fallbacks": self.fallbacks,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "lag_seconds": replica.lag,
+                    "healthy": replica.lag is not None and replica.lag <= self.max_lag,
+                    "pool": pool_stats(replica.engine) if replica.engine is not None else None,
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+replicas = ReplicaSet(
+    settings.replica_urls,
+    max_lag=settings.replica_max_lag_seconds,
+    check_interval=settings.replica_lag_check_seconds,
+)
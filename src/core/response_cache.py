@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Set, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database import AsyncUnitOfWork, ReadSessionLocal
+from core.events import RESET, subscribe
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_LIST_TAG = "articles:list"
+
+Loader = Callable[[AsyncSession], Awaitable[Tuple[bytes, Iterable[str]]]]
+
+
+def article_tag(article_id: int) -> str:
+    return f"article:{article_id}"
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    tags: FrozenSet[str]
+    fresh_until: float
+    stale_until: float
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float, client_max_age: int) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.cache_control = f"public, max-age={client_max_age}, stale-while-revalidate={int(stale_ttl)}"
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _store(self, key: str, body: bytes, tags: Iterable[str]) -> CachedResponse:
+        now = time.monotonic()
+        entry = CachedResponse(
+            body=body,
+            etag=_etag(body),
+            tags=frozenset(tags),
+            fresh_until=now + self.ttl,
+            stale_until=now + self.ttl + self.stale_ttl,
+        )
+        self._remove(key)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, *tags: str) -> None:
+        self._generation += 1
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _render(self, request: Request, entry: CachedResponse) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": self.cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if entry.etag in candidates or "*" in candidates:
+                self.not_modified += 1
+                return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    async def _refresh(self, key: str, loader: Loader) -> None:
+        generation = self._generation
+        try:
+            async with AsyncUnitOfWork(ReadSessionLocal) as session:
+                body, tags = await loader(session)
+        except Exception:
+            logger.debug("background refresh of %s failed", key, exc_info=True)
+            self._remove(key)
+        else:
+            if generation == self._generation:
+                self._store(key, body, tags)
+        finally:
+            self._refreshing.discard(key)
+
+    def _schedule_refresh(self, key: str, loader: Loader) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def respond(self, request: Request, loader: Loader, db: AsyncSession) -> Response:
+        key = self.key_for(request)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        elif entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            self._schedule_refresh(key, loader)
+        else:
+            self.misses += 1
+            generation = self._generation
+            if db.info.get("replica"):
+                # a lagging replica must not seed the cache every worker serves from
+                async with AsyncUnitOfWork(ReadSessionLocal) as session:
+                    body, tags = await loader(session)
+            else:
+                body, tags = await loader(db)
+            if generation == self._generation:
+                entry = self._store(key, body, tags)
+            else:
+                entry = CachedResponse(body=body, etag=_etag(body), tags=frozenset(), fresh_until=now, stale_until=now)
+        return self._render(request, entry)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+article_cache = ResponseCache(
+    maxsize=settings.article_cache_size,
+    ttl=settings.article_cache_ttl_seconds,
+    stale_ttl=settings.article_cache_stale_seconds,
+    client_max_age=settings.article_cache_client_max_age,
+)
+
+
+def _on_article_event(message: dict) -> None:
+    ids = message.get("ids") or ([message["id"]] if message.get("id") is not None else [])
+    tags = [article_tag(article_id) for article_id in ids]
+    if message.get("list"):
+        tags.append(ARTICLE_LIST_TAG)
+    article_cache.invalidate(*tags)
+
+
+def _on_comment_event(message: dict) -> None:
+    ids = message.get("article_ids") or [message["article_id"]]
+    article_cache.invalidate(*(article_tag(article_id) for article_id in ids))
+
+
+def _on_user_event(message: dict) -> None:
+    article_cache.invalidate(user_tag(message["id"]))
+
+
+subscribe("article", _on_article_event)
+subscribe("comment", _on_comment_event)
+subscribe("user", _on_user_event)
+subscribe(RESET, lambda message: article_cache.clear())
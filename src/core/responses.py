@@ -0,0 +1,60 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+import orjson
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any, exclude_unset: bool = False) -> bytes:
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, exclude_unset=exclude_unset)
+
+    def default(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json", exclude_unset=exclude_unset)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    return orjson.dumps(content, default=default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def __init__(self, content: Any, exclude_unset: bool = False, **kwargs) -> None:
+        self.exclude_unset = exclude_unset
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, exclude_unset=self.exclude_unset)
+
+
+def _respond_directly(endpoint: Callable, status_code: int, exclude_unset: bool) -> Callable:
+    def wrap(result: Any) -> Any:
+        if isinstance(result, Response):
+            return result
+        return FastJSONResponse(result, exclude_unset=exclude_unset, status_code=status_code)
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args, **kwargs):
+            return wrap(await endpoint(*args, **kwargs))
+
+        return async_endpoint
+
+    @functools.wraps(endpoint)
+    def sync_endpoint(*args, **kwargs):
+        return wrap(endpoint(*args, **kwargs))
+
+    return sync_endpoint
+
+
+class FastJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        status_code = kwargs.get("status_code") or 200
+        exclude_unset = kwargs.get("response_model_exclude_unset", False)
+        super().__init__(path, _respond_directly(endpoint, status_code, exclude_unset), **kwargs)
@@ -1,12 +1,23 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from core.config import settings
+from core.metrics import PASSWORD_HASH_LATENCY, PASSWORD_HASH_PENDING
 
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    pass
 
 
 def hash_password(password: str) -> str:
@@ -17,6 +28,78 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     return password_context.verify(plain_password, password_hash)
 
 
+class PasswordHasher:
+    def __init__(self, executor: str, workers: int, max_queue: int, timeout: float) -> None:
+        self._executor_kind = executor
+        self._workers = workers
+        self._capacity = workers + max_queue
+        self._timeout = timeout
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+        PASSWORD_HASH_PENDING.dec()
+
+    async def _run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self._capacity:
+                raise PasswordHasherBusy("password hashing queue is full")
+            self._pending += 1
+        PASSWORD_HASH_PENDING.inc()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise PasswordHasherBusy("password hashing timed out")
+        finally:
+            PASSWORD_HASH_LATENCY.labels(operation).observe(time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, plain_password: str, password_hash: str) -> bool:
+        return await self._run("verify", verify_password, plain_password, password_hash)
+
+    async def warm_up(self) -> None:
+        password_hash = await self.hash("warm-up")
+        await asyncio.gather(*(self.verify("warm-up", password_hash) for _ in range(self._workers)))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor=settings.password_hash_executor,
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+    timeout=settings.password_hash_timeout_seconds,
+)
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
     to_encode = {"sub": subject, "exp": expire}
@@ -26,4 +109,3 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
 def decode_access_token(token: str) -> dict:
     return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
 
-
@@ -0,0 +1,174 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"\$\d+(::[A-Z]+(\[\])?)?|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+RECORDER_STATE = "query_recorder"
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def statement_shape(statement: str) -> str:
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("(?, ...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryRecorder:
+    def __init__(self, parent: Optional["QueryRecorder"] = None) -> None:
+        self.parent = parent
+        self.queries: List[Tuple[str, float]] = []
+        self.timings: Dict[str, float] = {}
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def db_seconds(self) -> float:
+        return sum(duration for _, duration in self.queries)
+
+    def add(self, statement: str, duration: float) -> None:
+        recorder = self
+        while recorder is not None:
+            recorder.queries.append((statement, duration))
+            recorder = recorder.parent
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        shapes = Counter(statement_shape(statement) for statement, _ in self.queries)
+        return [(shape, n) for shape, n in shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        parts = [f'db;dur={self.db_seconds * 1000:.1f};desc="{self.count} queries"']
+        parts.extend(f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.timings.items())
+        return ", ".join(parts)
+
+
+_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("query_recorder", default=None)
+_unrecorded_listeners: List[Callable[[float], None]] = []
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    recorder = QueryRecorder(parent=_recorder.get())
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextmanager
+def request_queries(scope: Scope) -> Iterator[QueryRecorder]:
+    state = scope.setdefault("state", {})
+    recorder = state.get(RECORDER_STATE)
+    if recorder is not None:
+        yield recorder
+        return
+    with record_queries() as recorder:
+        state[RECORDER_STATE] = recorder
+        try:
+            yield recorder
+        finally:
+            del state[RECORDER_STATE]
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryRecorder]:
+    with record_queries() as recorder:
+        yield recorder
+    if recorder.count > max_queries:
+        statements = "\n".join(statement for statement, _ in recorder.queries)
+        raise QueryBudgetExceeded(f"{recorder.count} queries executed, budget is {max_queries}:\n{statements}")
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.timings[name] = recorder.timings.get(name, 0.0) + time.perf_counter() - started
+
+
+def on_unrecorded_query(listener: Callable[[float], None]) -> None:
+    if listener not in _unrecorded_listeners:
+        _unrecorded_listeners.append(listener)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("trace_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    duration = time.perf_counter() - conn.info["trace_started"].pop()
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.add(statement, duration)
+    else:
+        for listener in _unrecorded_listeners:
+            listener(duration)
+    if settings.slow_query_ms and duration * 1000 >= settings.slow_query_ms:
+        logger.warning("slow query (%.1f ms): %s", duration * 1000, _WHITESPACE.sub(" ", statement)[:1000])
+
+
+def _handle_error(context) -> None:
+    if context.connection is not None:
+        started = context.connection.info.get("trace_started")
+        if started:
+            started.pop()
+
+
+def instrument_engines() -> None:
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+class QueryTracingMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool, n_plus_one_threshold: int) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                recorder.timings["app"] = time.perf_counter() - started
+                message.setdefault("headers", []).append((b"server-timing", recorder.server_timing().encode("latin-1")))
+            await send(message)
+
+        with request_queries(scope) as recorder:
+            await self.app(scope, receive, send_wrapper)
+
+        if self.n_plus_one_threshold:
+            for shape, n in recorder.repeated_shapes(self.n_plus_one_threshold):
+                logger.warning("possible N+1 on %s %s: %d x %s", scope["method"], scope["path"], n, shape[:500])
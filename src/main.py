@@ -1,20 +1,105 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 
 from api.users import router as users_router
 from api.articles import router as articles_router
 from api.comments import router as comments_router
+from api.tags import router as tags_router
+from api.bulk import router as bulk_router
+from api.admin import router as admin_router
+from api.internal import router as internal_router
+from api.middleware import AdmissionMiddleware, ReadYourWritesMiddleware
+from core.admission import admission
+from core.config import settings
+from core.database import dispose_engine, init_engine
+from core.events import invalidation_listener
+from core.lifecycle import lifecycle, warm_up
+from core.metrics import MetricsMiddleware, observe_background_query, render as render_metrics, sample_event_loop_lag
+from core.tracing import QueryTracingMiddleware, instrument_engines, on_unrecorded_query
+from core.replicas import replicas
+from core.security import PasswordHasherBusy, password_hasher
+from services.view_counter import trending_refresher, view_counter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    engine = init_engine()
+    replicas.start()
+    listener = asyncio.create_task(invalidation_listener.run()) if settings.invalidation_bus_enabled else None
+    lag_monitor = asyncio.create_task(replicas.run()) if replicas else None
+    view_flusher = asyncio.create_task(view_counter.run()) if settings.view_counting_enabled else None
+    trending = asyncio.create_task(trending_refresher.run()) if settings.view_counting_enabled else None
+    loop_lag = (
+        asyncio.create_task(sample_event_loop_lag(settings.event_loop_lag_interval_seconds))
+        if settings.metrics_enabled
+        else None
+    )
+    await warm_up(engine, settings.warmup_connections)
+    lifecycle.ready = True
+    yield
+    lifecycle.ready = False
+    for task in (listener, lag_monitor, view_flusher, trending, loop_lag):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await view_counter.flush()
+    await replicas.dispose()
+    await dispose_engine()
+    password_hasher.shutdown()
+
+
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
 
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     @app.get("/healthz")
     def health_check():
         return {"status": "ok"}
 
+    @app.get("/readyz")
+    def readiness_check():
+        if not lifecycle.accepting:
+            return JSONResponse(status_code=503, content={"status": "draining" if lifecycle.draining else "starting"})
+        return {"status": "ready"}
+
+    if settings.metrics_enabled or settings.query_tracing_enabled:
+        instrument_engines()
+    if settings.metrics_enabled:
+        on_unrecorded_query(observe_background_query)
+
+        @app.get("/metrics", include_in_schema=False)
+        def metrics():
+            body, content_type = render_metrics()
+            return Response(content=body, media_type=content_type)
+
+    app.add_exception_handler(PasswordHasherBusy, password_hasher_busy_handler)
+    if replicas:
+        app.add_middleware(ReadYourWritesMiddleware, window=settings.read_your_writes_seconds)
+    if settings.query_tracing_enabled:
+        app.add_middleware(
+            QueryTracingMiddleware,
+            server_timing=settings.server_timing_enabled,
+            n_plus_one_threshold=settings.n_plus_one_threshold,
+        )
+    if settings.admission_enabled:
+        app.add_middleware(AdmissionMiddleware, controller=admission)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
     app.include_router(users_router)
     app.include_router(articles_router)
     app.include_router(comments_router)
+    app.include_router(tags_router)
+    app.include_router(bulk_router)
+    app.include_router(admin_router)
+    app.include_router(internal_router)
 
     return app
 
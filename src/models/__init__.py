@@ -2,3 +2,6 @@ from core.database import Base
 from .user import User
 from .article import Article
 from .comment import Comment
+from .tag import TagCount
+from .view import ArticleViewBucket, TrendingArticle
+from .follow import Follow, TimelineEntry
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import List
 
-from sqlalchemy import ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
@@ -9,13 +10,24 @@ from core.database import Base
 
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_created_at_id", "created_at", "id"),
+        Index("ix_articles_tag_list", "tag_list", postgresql_using="gin"),
+        Index("ix_articles_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_articles_author_id_created_at_id", "author_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(Text)
     body: Mapped[str] = mapped_column(Text)
     tag_list: Mapped[List[str] | None] = mapped_column(ARRAY(String), nullable=True)
-    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    comments_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    views_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
 
     author: Mapped["User"] = relationship(back_populates="articles")
-    comments: Mapped[List["Comment"]] = relationship(back_populates="article", cascade="all, delete-orphan")
+    comments: Mapped[List["Comment"]] = relationship(back_populates="article", cascade="all, delete-orphan", passive_deletes=True)
@@ -0,0 +1,11 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class TagCount(Base):
+    __tablename__ = "tag_counts"
+
+    tag: Mapped[str] = mapped_column(String, primary_key=True)
+    articles_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
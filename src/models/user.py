@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy import String, Text
+from sqlalchemy import Boolean, Integer, String, Text, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
@@ -8,6 +8,7 @@ from core.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     username: Mapped[str] = mapped_column(String, index=True, nullable=False)
@@ -15,6 +16,8 @@ class User(Base):
     password_hash: Mapped[str] = mapped_column(String, nullable=False)
     bio: Mapped[str | None] = mapped_column(Text, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
+    followers_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    feed_pull: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=false())
 
-    articles: Mapped[List["Article"]] = relationship(back_populates="author", cascade="all, delete-orphan")
-    comments: Mapped[List["Comment"]] = relationship(back_populates="author", cascade="all, delete-orphan")
+    articles: Mapped[List["Article"]] = relationship(back_populates="author", cascade="all, delete-orphan", passive_deletes=True)
+    comments: Mapped[List["Comment"]] = relationship(back_populates="author", cascade="all, delete-orphan", passive_deletes=True)
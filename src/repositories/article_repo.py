@@ -1,10 +1,43 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, cast, delete, func, literal, literal_column, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
+from core.config import settings
 from models.article import Article
 
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+
+
+def _search_config() -> ColumnElement:
+    return cast(literal(settings.search_language), REGCONFIG)
+
+
+def _weight(label: str) -> ColumnElement:
+    # setweight() takes "char"; a bound string parameter arrives as varchar and matches no overload
+    return literal_column(f"'{label}'::\"char\"")
+
+
+def search_vector(title: Optional[str], description: Optional[str], body: Optional[str]) -> ColumnElement:
+    config = _search_config()
+    return (
+        func.setweight(func.to_tsvector(config, title or ""), _weight("A"))
+        .op("||")(func.setweight(func.to_tsvector(config, description or ""), _weight("B")))
+        .op("||")(func.setweight(func.to_tsvector(config, body or ""), _weight("C")))
+    )
+
+
+def search_vector_sql() -> str:
+    language = settings.search_language
+    return (
+        f"setweight(to_tsvector('{language}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{language}', coalesce(description, '')), 'B') || "
+        f"setweight(to_tsvector('{language}', coalesce(body, '')), 'C')"
+    )
+
 
 class ArticleRepository:
     def __init__(self, db: AsyncSession) -> None:
@@ -13,10 +46,103 @@ class ArticleRepository:
     async def get_by_id(self, article_id: int) -> Optional[Article]:
         return await self.db.get(Article, article_id)
 
-    async def list(self, limit: int = 20, offset: int = 0) -> List[Article]:
-        stmt = select(Article).limit(limit).offset(offset)
+    async def list(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
+        tags_all: Optional[List[str]] = None,
+        tags_any: Optional[List[str]] = None,
+        include_body: bool = True,
+    ) -> List[Row]:
+        columns = [
+            Article.id,
+            Article.title,
+            Article.description,
+            Article.tag_list,
+            Article.author_id,
+            Article.created_at,
+            Article.comments_count,
+        ]
+        if include_body:
+            columns.append(Article.body)
+        stmt = select(*columns).order_by(Article.created_at.desc(), Article.id.desc()).limit(limit)
+        if tags_all:
+            stmt = stmt.where(Article.tag_list.contains(tags_all))
+        if tags_any:
+            stmt = stmt.where(Article.tag_list.overlap(tags_any))
+        if after is not None:
+            stmt = stmt.where(tuple_(Article.created_at, Article.id) < tuple_(*after))
+        elif offset:
+            stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.all()
+
+    async def search(self, query: str, limit: int = 20, after: Optional[Tuple[float, int]] = None) -> List[Row]:
+        config = _search_config()
+        tsquery = func.websearch_to_tsquery(config, query)
+        rank = func.ts_rank_cd(Article.search_vector, tsquery)
+        matches = select(Article.id, rank.label("rank")).where(Article.search_vector.op("@@")(tsquery))
+        if after is not None:
+            matches = matches.where(tuple_(rank, Article.id) < tuple_(*after))
+        matches = matches.order_by(rank.desc(), Article.id.desc()).limit(limit).subquery()
+        stmt = (
+            select(
+                Article.id,
+                Article.title,
+                Article.description,
+                Article.tag_list,
+                Article.author_id,
+                Article.created_at,
+                matches.c.rank,
+                func.ts_headline(config, Article.body, tsquery, HEADLINE_OPTIONS).label("headline"),
+            )
+            .join(matches, matches.c.id == Article.id)
+            .order_by(matches.c.rank.desc(), Article.id.desc())
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    async def adjust_comments_count(self, article_id: int, delta: int) -> None:
+        stmt = (
+            update(Article)
+            .where(Article.id == article_id)
+            .values(comments_count=Article.comments_count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(stmt)
+
+    async def adjust_comments_counts(self, deltas: Dict[int, int]) -> None:
+        deltas = {article_id: delta for article_id, delta in sorted(deltas.items()) if delta}
+        if not deltas:
+            return
+        await self.db.execute(
+            text(
+                "UPDATE articles a SET comments_count = a.comments_count + d.delta "
+                "FROM unnest(CAST(:ids AS integer[]), CAST(:deltas AS integer[])) AS d(id, delta) "
+                "WHERE a.id = d.id"
+            ),
+            {"ids": list(deltas), "deltas": list(deltas.values())},
+        )
+
+    async def id_range(self) -> Tuple[Optional[int], Optional[int]]:
+        result = await self.db.execute(select(func.min(Article.id), func.max(Article.id)))
+        return tuple(result.one())
+
+    async def reconcile_comments_count(self, start: int, stop: int) -> int:
+        params = {"start": start, "stop": stop}
+        await self.db.execute(text("SELECT 1 FROM articles WHERE id >= :start AND id < :stop FOR UPDATE"), params)
+        result = await self.db.execute(
+            text(
+                "UPDATE articles a SET comments_count = c.n "
+                "FROM (SELECT a2.id, count(cm.id) AS n FROM articles a2 "
+                "LEFT JOIN comments cm ON cm.article_id = a2.id "
+                "WHERE a2.id >= :start AND a2.id < :stop GROUP BY a2.id) c "
+                "WHERE a.id = c.id AND a.comments_count <> c.n"
+            ),
+            params,
+        )
+        return result.rowcount
 
     async def create(self, article: Article) -> Article:
         self.db.add(article)
@@ -28,4 +154,16 @@ class ArticleRepository:
         return article
 
     async def delete(self, article: Article) -> None:
-        self.db.delete(article)
+        await self.db.delete(article)
+        await self.db.flush()
+
+    async def delete_batch_by_author(self, author_id: int, limit: int) -> List[Row]:
+        ids = select(Article.id).where(Article.author_id == author_id).order_by(Article.id).limit(limit).scalar_subquery()
+        stmt = (
+            delete(Article)
+            .where(Article.id.in_(ids))
+            .returning(Article.id, Article.tag_list)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
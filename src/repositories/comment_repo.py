@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from models.article import Article
 from models.comment import Comment
 
 
@@ -13,10 +14,23 @@ class CommentRepository:
     async def get_by_id(self, comment_id: int) -> Optional[Comment]:
         return await self.db.get(Comment, comment_id)
 
-    async def list_by_article(self, article_id: int) -> List[Comment]:
-        stmt = select(Comment).where(Comment.article_id == article_id)
+    async def list_by_article(self, article_id: int, limit: int = 20, after_id: Optional[int] = None) -> Sequence[Row]:
+        stmt = select(Comment.id, Comment.body, Comment.author_id, Comment.article_id).where(Comment.article_id == article_id).order_by(Comment.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(Comment.id > after_id)
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.all()
+
+    async def stream_by_article(self, article_id: int, batch_size: int = 500) -> AsyncIterator[Sequence[Row]]:
+        stmt = (
+            select(Comment.id, Comment.body, Comment.author_id, Comment.article_id)
+            .where(Comment.article_id == article_id)
+            .order_by(Comment.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
 
     async def create(self, comment: Comment) -> Comment:
         self.db.add(comment)
@@ -24,4 +38,28 @@ class CommentRepository:
         return comment
 
     async def delete(self, comment: Comment) -> None:
-        self.db.delete(comment)
+        await self.db.delete(comment)
+
+    async def delete_batch_by_author(self, author_id: int, limit: int) -> List[int]:
+        ids = select(Comment.id).where(Comment.author_id == author_id).order_by(Comment.id).limit(limit).scalar_subquery()
+        stmt = (
+            delete(Comment)
+            .where(Comment.id.in_(ids))
+            .returning(Comment.article_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def delete_batch_on_articles_of(self, author_id: int, limit: int) -> int:
+        ids = (
+            select(Comment.id)
+            .join(Article, Article.id == Comment.article_id)
+            .where(Article.author_id == author_id)
+            .order_by(Comment.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        stmt = delete(Comment).where(Comment.id.in_(ids)).execution_options(synchronize_session=False)
+        result = await self.db.execute(stmt)
+        return result.rowcount
@@ -0,0 +1,39 @@
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.article import Article
+from models.comment import Comment
+from models.user import User
+
+EXPORT_COLUMNS = {
+    "articles": (Article, [Article.id, Article.title, Article.description, Article.body, Article.tag_list, Article.author_id, Article.created_at]),
+    "comments": (Comment, [Comment.id, Comment.body, Comment.author_id, Comment.article_id]),
+    "users": (User, [User.id, User.username, User.email, User.bio, User.image_url]),
+}
+
+
+class ExportRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def stream(
+        self,
+        entity: str,
+        after_id: int = 0,
+        fetch_size: int = 1000,
+        include_secrets: bool = False,
+    ) -> AsyncIterator[Sequence[Row]]:
+        model, columns = EXPORT_COLUMNS[entity]
+        if include_secrets and model is User:
+            columns = [*columns, User.password_hash]
+        stmt = (
+            select(*columns)
+            .where(model.id > after_id)
+            .order_by(model.id)
+            .execution_options(yield_per=fetch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, delete, select, text, true, tuple_, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.article import Article
+from models.follow import Follow, TimelineEntry
+from models.user import User
+
+
+class FeedRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def fan_out(self, article_id: int, author_id: int, created_at: datetime) -> int:
+        result = await self.db.execute(
+            text(
+                "INSERT INTO timeline_entries (user_id, created_at, article_id, author_id) "
+                "SELECT f.follower_id, :created_at, :article_id, :author_id "
+                "FROM follows f JOIN users u ON u.id = f.followee_id "
+                "WHERE f.followee_id = :author_id AND NOT u.feed_pull "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"article_id": article_id, "author_id": author_id, "created_at": created_at},
+        )
+        return result.rowcount
+
+    async def fan_out_many(self, article_ids: Sequence[int], replaced_ids: Sequence[int] = ()) -> int:
+        if replaced_ids:
+            await self.db.execute(
+                delete(TimelineEntry)
+                .where(TimelineEntry.article_id.in_(replaced_ids))
+                .execution_options(synchronize_session=False)
+            )
+        if not article_ids:
+            return 0
+        result = await self.db.execute(
+            text(
+                "INSERT INTO timeline_entries (user_id, created_at, article_id, author_id) "
+                "SELECT f.follower_id, a.created_at, a.id, a.author_id "
+                "FROM articles a JOIN users u ON u.id = a.author_id AND NOT u.feed_pull "
+                "JOIN follows f ON f.followee_id = a.author_id "
+                "WHERE a.id = ANY(CAST(:ids AS integer[])) "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"ids": list(article_ids)},
+        )
+        return result.rowcount
+
+    async def backfill(self, user_id: int, author_id: int, limit: int) -> int:
+        result = await self.db.execute(
+            text(
+                "INSERT INTO timeline_entries (user_id, created_at, article_id, author_id) "
+                "SELECT :user_id, created_at, id, author_id FROM articles WHERE author_id = :author_id "
+                "ORDER BY created_at DESC, id DESC LIMIT :limit "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"user_id": user_id, "author_id": author_id, "limit": limit},
+        )
+        return result.rowcount
+
+    async def remove_author(self, user_id: int, author_id: int) -> int:
+        result = await self.db.execute(
+            delete(TimelineEntry).where(TimelineEntry.user_id == user_id, TimelineEntry.author_id == author_id)
+        )
+        return result.rowcount
+
+    async def page(
+        self,
+        user_id: int,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        pushed = select(TimelineEntry.article_id.label("id"), TimelineEntry.created_at).where(TimelineEntry.user_id == user_id)
+        if after is not None:
+            pushed = pushed.where(tuple_(TimelineEntry.created_at, TimelineEntry.article_id) < tuple_(*after))
+        pushed = pushed.order_by(TimelineEntry.created_at.desc(), TimelineEntry.article_id.desc()).limit(limit).subquery()
+
+        popular = (
+            select(Follow.followee_id)
+            .join(User, User.id == Follow.followee_id)
+            .where(Follow.follower_id == user_id, User.feed_pull)
+            .subquery()
+        )
+        recent = select(Article.id, Article.created_at).where(Article.author_id == popular.c.followee_id)
+        if after is not None:
+            recent = recent.where(tuple_(Article.created_at, Article.id) < tuple_(*after))
+        recent = recent.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit).lateral()
+        pulled = select(recent.c.id, recent.c.created_at).select_from(popular.join(recent, true()))
+
+        merged = union(select(pushed.c.id, pushed.c.created_at), pulled).subquery()
+        stmt = (
+            select(
+                Article.id,
+                Article.title,
+                Article.description,
+                Article.tag_list,
+                Article.author_id,
+                Article.created_at,
+                Article.comments_count,
+            )
+            .join(merged, merged.c.id == Article.id)
+            .order_by(merged.c.created_at.desc(), merged.c.id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
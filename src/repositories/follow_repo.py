@@ -0,0 +1,72 @@
+from typing import Optional
+
+from sqlalchemy import Row, delete, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.follow import Follow
+from models.user import User
+
+
+class FollowRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def add(self, follower_id: int, followee_id: int) -> bool:
+        stmt = (
+            insert(Follow)
+            .values(follower_id=follower_id, followee_id=followee_id)
+            .on_conflict_do_nothing(index_elements=[Follow.follower_id, Follow.followee_id])
+            .returning(Follow.followee_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def remove(self, follower_id: int, followee_id: int) -> bool:
+        stmt = (
+            delete(Follow)
+            .where(Follow.follower_id == follower_id, Follow.followee_id == followee_id)
+            .returning(Follow.followee_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def followers_count(self, user_id: int) -> int:
+        result = await self.db.execute(select(User.followers_count).where(User.id == user_id))
+        return result.scalar_one()
+
+    async def add_follower(self, user_id: int, pull_above: int) -> Row:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                followers_count=User.followers_count + 1,
+                feed_pull=User.feed_pull | (User.followers_count + 1 > pull_above),
+            )
+            .returning(User.followers_count, User.feed_pull)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.one()
+
+    async def adjust_followers_count(self, user_id: int, delta: int) -> Optional[int]:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(followers_count=User.followers_count + delta)
+            .returning(User.followers_count)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def release_follower(self, follower_id: int) -> int:
+        result = await self.db.execute(
+            text(
+                "WITH gone AS (DELETE FROM follows WHERE follower_id = :id RETURNING followee_id) "
+                "UPDATE users u SET followers_count = u.followers_count - 1 "
+                "FROM gone WHERE u.id = gone.followee_id"
+            ),
+            {"id": follower_id},
+        )
+        return result.rowcount
@@ -0,0 +1,139 @@
+from typing import Dict, List, NamedTuple, Sequence
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.article_repo import search_vector_sql
+
+class ArticleMerge(NamedTuple):
+    merged: int
+    rejected: int
+    tag_deltas: Dict[str, int]
+    ids: List[int]
+    replaced_ids: List[int]
+
+
+class CommentMerge(NamedTuple):
+    merged: int
+    rejected: int
+    article_ids: List[int]
+
+
+ARTICLE_COLUMNS = ("id", "title", "description", "body", "tag_list", "author_id", "created_at")
+COMMENT_COLUMNS = ("id", "body", "author_id", "article_id")
+
+
+class ImportRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def _driver_connection(self) -> asyncpg.Connection:
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        return raw.driver_connection
+
+    async def _stage(self, table: str, ddl: str, columns: Sequence[str], records: Sequence[tuple]) -> None:
+        await self.db.execute(text(f"CREATE TEMP TABLE {table} ({ddl}) ON COMMIT DROP"))
+        driver = await self._driver_connection()
+        await driver.copy_records_to_table(table, records=records, columns=columns)
+
+    async def _count(self, sql: str) -> int:
+        result = await self.db.execute(text(sql))
+        return result.scalar_one()
+
+    async def merge_articles(self, records: Sequence[tuple]) -> ArticleMerge:
+        await self._stage(
+            "import_articles",
+            "id integer, title text, description text, body text, tag_list varchar[], author_id integer, created_at timestamptz",
+            ARTICLE_COLUMNS,
+            records,
+        )
+        rejected = await self._count(
+            "WITH bad AS (DELETE FROM import_articles s "
+            "WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = s.author_id) RETURNING 1) "
+            "SELECT count(*) FROM bad"
+        )
+        await self.db.execute(
+            text("UPDATE import_articles SET id = nextval(pg_get_serial_sequence('articles', 'id')) WHERE id IS NULL")
+        )
+        tag_rows = await self.db.execute(
+            text(
+                "SELECT tag, sum(delta)::integer FROM ("
+                "SELECT DISTINCT s.id, tag, 1 AS delta FROM "
+                "(SELECT DISTINCT ON (id) id, tag_list FROM import_articles ORDER BY id, ctid DESC) s, unnest(s.tag_list) AS tag "
+                "UNION ALL "
+                "SELECT DISTINCT a.id, tag, -1 FROM articles a JOIN import_articles s ON s.id = a.id, unnest(a.tag_list) AS tag"
+                ") d GROUP BY tag"
+            )
+        )
+        tag_deltas = dict(tag_rows.all())
+        result = await self.db.execute(
+            text(
+                "WITH merged AS ("
+                "INSERT INTO articles (id, title, description, body, tag_list, author_id, created_at, search_vector) "
+                "SELECT DISTINCT ON (id) id, title, description, body, tag_list, author_id, "
+                f"coalesce(created_at, now()), {search_vector_sql()} "
+                "FROM import_articles ORDER BY id, ctid DESC "
+                "ON CONFLICT (id) DO UPDATE SET title = excluded.title, description = excluded.description, "
+                "body = excluded.body, tag_list = excluded.tag_list, author_id = excluded.author_id, "
+                "created_at = excluded.created_at, search_vector = excluded.search_vector "
+                "RETURNING id, xmax <> 0 AS replaced) "
+                "SELECT coalesce(array_agg(id), '{}'), coalesce(array_agg(id) FILTER (WHERE replaced), '{}') FROM merged"
+            )
+        )
+        ids, replaced_ids = result.one()
+        return ArticleMerge(len(ids), rejected, tag_deltas, list(ids), list(replaced_ids))
+
+    async def merge_comments(self, records: Sequence[tuple]) -> CommentMerge:
+        await self._stage(
+            "import_comments",
+            "id integer, body text, author_id integer, article_id integer",
+            COMMENT_COLUMNS,
+            records,
+        )
+        rejected = await self._count(
+            "WITH bad AS (DELETE FROM import_comments s "
+            "WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = s.author_id) "
+            "OR NOT EXISTS (SELECT 1 FROM articles a WHERE a.id = s.article_id) RETURNING 1) "
+            "SELECT count(*) FROM bad"
+        )
+        await self.db.execute(
+            text("UPDATE import_comments SET id = nextval(pg_get_serial_sequence('comments', 'id')) WHERE id IS NULL")
+        )
+        await self.db.execute(
+            text(
+                "CREATE TEMP TABLE import_comment_articles ON COMMIT DROP AS "
+                "SELECT article_id FROM import_comments "
+                "UNION SELECT c.article_id FROM comments c JOIN import_comments s ON s.id = c.id"
+            )
+        )
+        merged = await self._count(
+            "WITH merged AS ("
+            "INSERT INTO comments (id, body, author_id, article_id) "
+            "SELECT DISTINCT ON (id) id, body, author_id, article_id "
+            "FROM import_comments ORDER BY id, ctid DESC "
+            "ON CONFLICT (id) DO UPDATE SET body = excluded.body, author_id = excluded.author_id, "
+            "article_id = excluded.article_id "
+            "RETURNING 1) SELECT count(*) FROM merged"
+        )
+        await self.db.execute(
+            text(
+                "UPDATE articles a SET comments_count = (SELECT count(*) FROM comments c WHERE c.article_id = a.id) "
+                "WHERE a.id IN (SELECT article_id FROM import_comment_articles)"
+            )
+        )
+        article_ids = await self.db.execute(text("SELECT article_id FROM import_comment_articles ORDER BY article_id"))
+        return CommentMerge(merged, rejected, list(article_ids.scalars()))
+
+    async def sync_sequence(self, table: str) -> None:
+        await self.db.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"greatest(max(id), pg_sequence_last_value(pg_get_serial_sequence('{table}', 'id')::regclass))) "
+                f"FROM {table} HAVING max(id) IS NOT NULL"
+            )
+        )
+
+    async def commit(self) -> None:
+        await self.db.commit()
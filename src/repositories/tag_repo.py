@@ -0,0 +1,46 @@
+from typing import Dict, List
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.tag import TagCount
+
+
+class TagRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def popular(self, limit: int = 20) -> List[TagCount]:
+        stmt = (
+            select(TagCount)
+            .where(TagCount.articles_count > 0)
+            .order_by(TagCount.articles_count.desc(), TagCount.tag)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def adjust(self, deltas: Dict[str, int]) -> None:
+        deltas = {tag: delta for tag, delta in sorted(deltas.items()) if delta}
+        if not deltas:
+            return
+        stmt = insert(TagCount).values([{"tag": tag, "articles_count": delta} for tag, delta in deltas.items()])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TagCount.tag],
+            set_={"articles_count": TagCount.articles_count + stmt.excluded.articles_count},
+        )
+        await self.db.execute(stmt)
+        if any(delta < 0 for delta in deltas.values()):
+            await self.db.execute(
+                delete(TagCount).where(TagCount.tag.in_(list(deltas)), TagCount.articles_count <= 0)
+            )
+
+    async def rebuild(self) -> None:
+        await self.db.execute(delete(TagCount))
+        await self.db.execute(
+            text(
+                "INSERT INTO tag_counts (tag, articles_count) "
+                "SELECT tag, count(DISTINCT id) FROM articles, unnest(tag_list) AS tag GROUP BY tag"
+            )
+        )
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from models.user import User
 
@@ -18,13 +19,28 @@ class UserRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_profiles(self, user_ids: Sequence[int]) -> List[Row]:
+        stmt = select(User.id, User.username, User.bio, User.image_url).where(User.id.in_(user_ids))
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    async def attach(self, values: dict) -> User:
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await self.db.merge(user, load=False)
+
+    @staticmethod
+    def snapshot(user: User) -> dict:
+        return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
     async def create(self, user: User) -> User: 
         self.db.add(user)
         await self.db.flush()
         return user
 
     async def delete(self, user: User) -> None:
-        self.db.delete(user)
+        await self.db.delete(user)
+        await self.db.flush()
 
     async def update(self, user: User) -> User:
         await self.db.flush()
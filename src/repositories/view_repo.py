@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import Row, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.article import Article
+from models.view import TrendingArticle
+
+TRENDING_LOCK_ID = 7243001
+
+
+class ViewRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def add_views(self, counts: Dict[int, int], bucket_start: datetime) -> None:
+        counts = {article_id: n for article_id, n in sorted(counts.items()) if n > 0}
+        if not counts:
+            return
+        params = {"ids": list(counts), "views": list(counts.values()), "bucket": bucket_start}
+        # the UPDATE locks rows in whatever order its join produces; take them by id first so
+        # concurrent flushes from other workers queue up instead of deadlocking
+        await self.db.execute(
+            text("SELECT id FROM articles WHERE id = ANY(CAST(:ids AS integer[])) ORDER BY id FOR UPDATE"),
+            params,
+        )
+        await self.db.execute(
+            text(
+                "UPDATE articles a SET views_count = a.views_count + d.views "
+                "FROM unnest(CAST(:ids AS integer[]), CAST(:views AS integer[])) AS d(id, views) "
+                "WHERE a.id = d.id"
+            ),
+            params,
+        )
+        await self.db.execute(
+            text(
+                "INSERT INTO article_view_buckets (article_id, bucket_start, views) "
+                "SELECT d.id, :bucket, d.views "
+                "FROM unnest(CAST(:ids AS integer[]), CAST(:views AS integer[])) AS d(id, views) "
+                "JOIN articles a ON a.id = d.id "
+                "ON CONFLICT (article_id, bucket_start) "
+                "DO UPDATE SET views = article_view_buckets.views + EXCLUDED.views"
+            ),
+            params,
+        )
+
+    async def try_lock_trending(self) -> bool:
+        result = await self.db.execute(select(func.pg_try_advisory_xact_lock(TRENDING_LOCK_ID)))
+        return result.scalar_one()
+
+    async def trending_computed_at(self) -> Optional[datetime]:
+        result = await self.db.execute(select(func.max(TrendingArticle.computed_at)))
+        return result.scalar_one()
+
+    async def rebuild_trending(self, half_life_seconds: float, window_seconds: float, size: int) -> int:
+        params = {"half_life": half_life_seconds, "window": window_seconds, "size": size}
+        await self.db.execute(
+            text("DELETE FROM article_view_buckets WHERE bucket_start < now() - make_interval(secs => :window)"),
+            params,
+        )
+        await self.db.execute(text("DELETE FROM trending_articles"))
+        result = await self.db.execute(
+            text(
+                "INSERT INTO trending_articles (article_id, score, views, computed_at) "
+                "SELECT article_id, "
+                "sum(views * power(0.5, EXTRACT(EPOCH FROM now() - bucket_start) / :half_life)) AS score, "
+                "sum(views), now() "
+                "FROM article_view_buckets GROUP BY article_id "
+                "ORDER BY score DESC LIMIT :size"
+            ),
+            params,
+        )
+        return result.rowcount
+
+    async def trending(self, limit: int) -> List[Row]:
+        stmt = (
+            select(
+                Article.id,
+                Article.title,
+                Article.description,
+                Article.tag_list,
+                Article.author_id,
+                Article.created_at,
+                Article.comments_count,
+                Article.views_count,
+                TrendingArticle.score,
+                TrendingArticle.views.label("recent_views"),
+                TrendingArticle.computed_at,
+            )
+            .join(TrendingArticle, TrendingArticle.article_id == Article.id)
+            .order_by(TrendingArticle.score.desc(), Article.id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
+from schemas.user import AuthorOut
+
 
 class ArticleCreate(BaseModel):
     title: str
@@ -25,4 +28,67 @@ class ArticleOut(BaseModel):
     body: str
     tag_list: List[str] = Field(default_factory=list)
     author_id: int
+    created_at: datetime
+    comments_count: int = 0
+    views_count: int = 0
+
+
+class ArticleWithAuthorOut(ArticleOut):
+    author: Optional[AuthorOut] = None
+
+
+class ArticleSummaryOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    description: str
+    body: Optional[str] = None
+    tag_list: List[str] = Field(default_factory=list)
+    author_id: int
+    created_at: datetime
+    comments_count: int = 0
+    author: Optional[AuthorOut] = None
+
+
+class ArticleListOut(BaseModel):
+    articles: List[ArticleSummaryOut]
+    next_cursor: Optional[str] = None
+
+
+class TrendingArticleOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    description: str
+    tag_list: List[str] = Field(default_factory=list)
+    author_id: int
+    created_at: datetime
+    comments_count: int = 0
+    views_count: int = 0
+    score: float
+    recent_views: int
+
+
+class TrendingListOut(BaseModel):
+    articles: List[TrendingArticleOut]
+    computed_at: Optional[datetime] = None
+
+
+class ArticleSearchHit(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    description: str
+    tag_list: List[str] = Field(default_factory=list)
+    author_id: int
+    created_at: datetime
+    rank: float
+    headline: str
+
 
+class ArticleSearchOut(BaseModel):
+    articles: List[ArticleSearchHit]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class _ImportRecord(BaseModel):
+    @model_validator(mode="before")
+    @classmethod
+    def _blank_to_none(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {k: (None if v == "" else v) for k, v in data.items()}
+        return data
+
+
+class ArticleImport(_ImportRecord):
+    id: Optional[int] = None
+    title: str
+    description: str
+    body: str
+    tag_list: List[str] = Field(default_factory=list)
+    author_id: int
+    created_at: Optional[datetime] = None
+
+    @field_validator("tag_list", mode="before")
+    @classmethod
+    def _split_tags(cls, value: Any) -> Any:
+        if value is None:
+            return []
+        if isinstance(value, str):
+            if value.startswith("["):
+                return json.loads(value)
+            return [tag.strip() for tag in value.split(",") if tag.strip()]
+        return value
+
+
+class CommentImport(_ImportRecord):
+    id: Optional[int] = None
+    body: str
+    author_id: int
+    article_id: int
+
+
+class ImportReport(BaseModel):
+    received: int = 0
+    imported: int = 0
+    rejected: int = 0
+    errors: List[str] = Field(default_factory=list)
@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from schemas.user import AuthorOut
 
 
 class CommentCreate(BaseModel):
@@ -6,8 +10,18 @@ class CommentCreate(BaseModel):
 
 
 class CommentOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     body: str
     author_id: int
     article_id: int
 
+
+class CommentWithAuthorOut(CommentOut):
+    author: Optional[AuthorOut] = None
+
+
+class CommentListOut(BaseModel):
+    comments: List[CommentWithAuthorOut]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,12 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class TagOut(BaseModel):
+    tag: str
+    count: int
+
+
+class TagListOut(BaseModel):
+    tags: List[TagOut]
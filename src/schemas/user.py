@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 
 
@@ -30,3 +30,17 @@ class UserOut(BaseModel):
     bio: Optional[str] = None
     image_url: Optional[str] = None
 
+
+class AuthorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    username: str
+    bio: Optional[str] = None
+    image_url: Optional[str] = None
+
+
+class FollowOut(BaseModel):
+    user_id: int
+    following: bool
+    followers_count: int
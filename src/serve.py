@@ -0,0 +1,109 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+import uvicorn
+from prometheus_client import multiprocess
+from uvicorn.supervisors import Multiprocess
+
+from core.config import settings
+from core.lifecycle import lifecycle
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def _available(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+class DrainingServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, drain_delay: float) -> None:
+        super().__init__(config)
+        self.drain_delay = drain_delay
+
+    def handle_exit(self, sig, frame) -> None:
+        if lifecycle.draining:
+            logger.warning("second shutdown signal, exiting without waiting for open requests")
+            self.should_exit = self.force_exit = True
+            return
+        if self.drain_delay <= 0:
+            super().handle_exit(sig, frame)
+            return
+        lifecycle.draining = True
+        logger.info("draining for %.1fs before shutdown", self.drain_delay)
+        timer = threading.Timer(self.drain_delay, super().handle_exit, (sig, frame))
+        timer.daemon = True
+        timer.start()
+
+
+class WorkerSupervisor(Multiprocess):
+    def keep_subprocess_alive(self) -> None:
+        pids = {process.pid for process in self.processes}
+        super().keep_subprocess_alive()
+        for pid in pids - {process.pid for process in self.processes}:
+            _mark_dead(pid)
+
+    def join_all(self) -> None:
+        # a second signal only reaches the parent, so pass it on to the workers as a kill
+        for process in self.processes:
+            while process.process.is_alive():
+                process.process.join(0.5)
+                if self.signal_queue and process.process.is_alive():
+                    logger.warning("second shutdown signal, killing workers")
+                    for worker in self.processes:
+                        worker.kill()
+                    self.signal_queue.clear()
+            _mark_dead(process.pid)
+
+
+def _mark_dead(pid: Optional[int]) -> None:
+    if pid is not None and "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+def _prepare_multiprocess_dir() -> Optional[str]:
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    created = None
+    if not path:
+        path = created = tempfile.mkdtemp(prefix="prometheus-multiproc-")
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    return created
+
+
+def main() -> None:
+    config = uvicorn.Config(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.web_concurrency,
+        loop="uvloop" if _available("uvloop") else "asyncio",
+        http="httptools" if _available("httptools") else "h11",
+        lifespan="on",
+        timeout_graceful_shutdown=settings.graceful_shutdown_seconds,
+    )
+    server = DrainingServer(config, drain_delay=settings.drain_delay_seconds)
+    if config.workers <= 1:
+        server.run()
+        return
+    created = _prepare_multiprocess_dir() if settings.metrics_enabled else None
+    try:
+        sock = config.bind_socket()
+        WorkerSupervisor(config, target=server.run, sockets=[sock]).run()
+    finally:
+        if created:
+            shutil.rmtree(created, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,70 @@
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy import Row
+
+from core.pagination import decode_cursor, encode_cursor
+from core.events import publish
 from models.article import Article
-from repositories.article_repo import ArticleRepository
+from repositories.article_repo import ArticleRepository, search_vector
+from repositories.tag_repo import TagRepository
 
 
 class ArticleService:
-    def __init__(self, repo: ArticleRepository) -> None:
+    def __init__(self, repo: ArticleRepository, tags: TagRepository) -> None:
         self._repo = repo
+        self._tags = tags
+
+    async def list(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        tags_all: Optional[List[str]] = None,
+        tags_any: Optional[List[str]] = None,
+        include_body: bool = True,
+    ) -> Tuple[List[Row], Optional[str]]:
+        after = tuple(decode_cursor(cursor, datetime, int)) if cursor else None
+        items = await self._repo.list(
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            tags_all=tags_all,
+            tags_any=tags_any,
+            include_body=include_body,
+        )
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        last = items[-1]
+        return items, encode_cursor(last.created_at, last.id)
 
-    async def list(self, limit: int = 20, offset: int = 0) -> List[Article]:
-        return await self._repo.list(limit=limit, offset=offset)
+    async def search(self, query: str, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Row], Optional[str]]:
+        after = tuple(decode_cursor(cursor, float, int)) if cursor else None
+        rows = await self._repo.search(query, limit=limit + 1, after=after)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.rank, last.id)
 
     async def get(self, article_id: int) -> Optional[Article]:
         return await self._repo.get_by_id(article_id)
 
     async def create(self, title: str, description: str, body: str, tag_list: Optional[List[str]], author_id: int) -> Article:
-        article = Article(title=title, description=description, body=body, tag_list=tag_list, author_id=author_id)
-        return await self._repo.create(article)
+        article = Article(
+            title=title,
+            description=description,
+            body=body,
+            tag_list=tag_list,
+            author_id=author_id,
+            search_vector=search_vector(title, description, body),
+        )
+        article = await self._repo.create(article)
+        await self._tags.adjust(Counter(set(tag_list or [])))
+        await publish(self._repo.db, "article", article.id, list=True)
+        return article
 
     async def update(self, article: Article, title: Optional[str] = None, description: Optional[str] = None, body: Optional[str] = None, tag_list: Optional[List[str]] = None) -> Article:
         if title is not None:
@@ -25,9 +73,22 @@ class ArticleService:
             article.description = description
         if body is not None:
             article.body = body
+        if title is not None or description is not None or body is not None:
+            article.search_vector = search_vector(article.title, article.description, article.body)
+        tags_changed = False
         if tag_list is not None:
+            old_tags, new_tags = set(article.tag_list or []), set(tag_list)
             article.tag_list = tag_list
-        return await self._repo.update(article)
+            deltas = Counter(new_tags - old_tags)
+            deltas.subtract(old_tags - new_tags)
+            await self._tags.adjust(deltas)
+            tags_changed = bool(deltas)
+        article = await self._repo.update(article)
+        await publish(self._repo.db, "article", article.id, list=tags_changed)
+        return article
 
     async def delete(self, article: Article) -> None:
+        tags = set(article.tag_list or [])
         await self._repo.delete(article)
+        await self._tags.adjust({tag: -1 for tag in tags})
+        await publish(self._repo.db, "article", article.id, list=True)
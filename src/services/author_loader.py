@@ -0,0 +1,36 @@
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.user_repo import UserRepository
+from schemas.user import AuthorOut
+
+
+def wants_author(include: Optional[str]) -> bool:
+    return include is not None and "author" in {part.strip() for part in include.split(",")}
+
+
+class AuthorLoader:
+    def __init__(self, repo: UserRepository) -> None:
+        self._repo = repo
+        self._loaded: Dict[int, Optional[AuthorOut]] = {}
+
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "AuthorLoader":
+        loader = db.info.get("author_loader")
+        if loader is None:
+            loader = db.info["author_loader"] = cls(UserRepository(db))
+        return loader
+
+    async def load_many(self, user_ids: Iterable[int]) -> Dict[int, Optional[AuthorOut]]:
+        user_ids = set(user_ids)
+        missing = user_ids - self._loaded.keys()
+        if missing:
+            for row in await self._repo.get_profiles(sorted(missing)):
+                self._loaded[row.id] = AuthorOut.model_validate(row, from_attributes=True)
+            for user_id in missing:
+                self._loaded.setdefault(user_id, None)
+        return {user_id: self._loaded[user_id] for user_id in user_ids}
+
+    async def load(self, user_id: int) -> Optional[AuthorOut]:
+        return (await self.load_many([user_id]))[user_id]
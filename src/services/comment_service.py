@@ -1,19 +1,52 @@
-from typing import List
+from typing import AsyncIterator, Callable, Optional, Sequence, Tuple
 
+from sqlalchemy import Row
+
+from core.pagination import decode_cursor, encode_cursor
+from core.events import RESET, publish
 from models.comment import Comment
+from repositories.article_repo import ArticleRepository
 from repositories.comment_repo import CommentRepository
 
 
 class CommentService:
-    def __init__(self, repo: CommentRepository) -> None:
+    def __init__(self, repo: CommentRepository, articles: ArticleRepository) -> None:
         self._repo = repo
+        self._articles = articles
+
+    async def list_for_article(self, article_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[Sequence[Row], Optional[str]]:
+        after_id = decode_cursor(cursor, int)[0] if cursor else None
+        items = await self._repo.list_by_article(article_id, limit=limit + 1, after_id=after_id)
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, encode_cursor(items[-1].id)
 
-    async def list_for_article(self, article_id: int) -> List[Comment]:
-        return await self._repo.list_by_article(article_id)
+    def stream_for_article(self, article_id: int, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        return self._repo.stream_by_article(article_id, batch_size=batch_size)
 
     async def add(self, body: str, article_id: int, author_id: int) -> Comment:
         comment = Comment(body=body, article_id=article_id, author_id=author_id)
-        return await self._repo.create(comment)
+        comment = await self._repo.create(comment)
+        await self._articles.adjust_comments_count(article_id, 1)
+        await publish(self._repo.db, "comment", comment.id, article_id=article_id)
+        return comment
 
     async def delete(self, comment: Comment) -> None:
         await self._repo.delete(comment)
+        await self._articles.adjust_comments_count(comment.article_id, -1)
+        await publish(self._repo.db, "comment", comment.id, article_id=comment.article_id)
+
+    async def reconcile_counts(self, batch_size: int = 5000, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        low, high = await self._articles.id_range()
+        if low is None:
+            return 0
+        fixed = 0
+        for start in range(low, high + 1, batch_size):
+            fixed += await self._articles.reconcile_comments_count(start, start + batch_size)
+            await self._articles.db.commit()
+            if progress:
+                progress(min(start + batch_size - 1, high), fixed)
+        await publish(self._articles.db, RESET)
+        await self._articles.db.commit()
+        return fixed
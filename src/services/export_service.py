@@ -0,0 +1,59 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Tuple
+
+from repositories.export_repo import EXPORT_COLUMNS, ExportRepository
+
+ENTITIES = tuple(EXPORT_COLUMNS)
+COMPRESSIONS = ("gzip", "zstd", "none")
+EXTENSIONS = {"gzip": ".ndjson.gz", "zstd": ".ndjson.zst", "none": ".ndjson"}
+MEDIA_TYPES = {"gzip": "application/gzip", "zstd": "application/zstd", "none": "application/x-ndjson"}
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def make_compressor(kind: str) -> Any:
+    if kind == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if kind == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression requires the zstandard package")
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    if kind == "none":
+        return _Identity()
+    raise ValueError(f"unknown compression {kind!r}")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"cannot serialize {type(value).__name__}")
+
+
+class ExportService:
+    def __init__(self, repo: ExportRepository, fetch_size: int = 1000) -> None:
+        self._repo = repo
+        self._fetch_size = fetch_size
+
+    async def stream(self, entity: str, after_id: int = 0, include_secrets: bool = False) -> AsyncIterator[Tuple[int, int, bytes]]:
+        if entity not in ENTITIES:
+            raise ValueError(f"unknown entity {entity!r}")
+        async for rows in self._repo.stream(entity, after_id=after_id, fetch_size=self._fetch_size, include_secrets=include_secrets):
+            chunk = "".join(json.dumps(row._asdict(), default=_default, separators=(",", ":")) + "\n" for row in rows)
+            yield rows[-1].id, len(rows), chunk.encode()
+
+    async def stream_compressed(self, entity: str, compressor: Any, after_id: int = 0) -> AsyncIterator[bytes]:
+        async for _, _, chunk in self.stream(entity, after_id=after_id):
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
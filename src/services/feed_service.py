@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.pagination import decode_cursor, encode_cursor
+from models.article import Article
+from repositories.feed_repo import FeedRepository
+from repositories.follow_repo import FollowRepository
+
+
+class FeedService:
+    def __init__(self, follows: FollowRepository, feed: FeedRepository, fanout_max_followers: int, backfill_size: int) -> None:
+        self._follows = follows
+        self._feed = feed
+        self._fanout_max_followers = fanout_max_followers
+        self._backfill_size = backfill_size
+
+    async def follow(self, follower_id: int, followee_id: int) -> int:
+        if follower_id == followee_id:
+            raise ValueError("cannot follow yourself")
+        if not await self._follows.add(follower_id, followee_id):
+            return await self._follows.followers_count(followee_id)
+        followee = await self._follows.add_follower(followee_id, pull_above=self._fanout_max_followers)
+        if not followee.feed_pull:
+            await self._feed.backfill(follower_id, followee_id, self._backfill_size)
+        return followee.followers_count
+
+    async def unfollow(self, follower_id: int, followee_id: int) -> int:
+        if not await self._follows.remove(follower_id, followee_id):
+            return await self._follows.followers_count(followee_id)
+        await self._feed.remove_author(follower_id, followee_id)
+        return await self._follows.adjust_followers_count(followee_id, -1)
+
+    async def publish(self, article: Article) -> int:
+        return await self._feed.fan_out(article.id, article.author_id, article.created_at)
+
+    async def page(self, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Row], Optional[str]]:
+        after = tuple(decode_cursor(cursor, datetime, int)) if cursor else None
+        rows = await self._feed.page(user_id, limit=limit + 1, after=after)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.created_at, last.id)
+
+
+def make_feed_service(db: AsyncSession) -> FeedService:
+    return FeedService(
+        FollowRepository(db),
+        FeedRepository(db),
+        fanout_max_followers=settings.feed_fanout_max_followers,
+        backfill_size=settings.feed_backfill_size,
+    )
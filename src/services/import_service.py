@@ -0,0 +1,127 @@
+import csv
+import json
+from typing import Callable, Iterable, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from core.events import chunked, publish
+from repositories.feed_repo import FeedRepository
+from repositories.import_repo import ARTICLE_COLUMNS, COMMENT_COLUMNS, ImportRepository
+from repositories.tag_repo import TagRepository
+from schemas.bulk import ArticleImport, CommentImport, ImportReport
+
+MAX_REPORTED_ERRORS = 100
+
+Record = Union[str, dict]
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        error = exc.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return f"{location}: {error['msg']}" if location else error["msg"]
+    return str(exc)
+
+
+def read_records(lines: Iterable[str], fmt: str) -> Iterator[Record]:
+    if fmt == "csv":
+        yield from csv.DictReader(lines)
+    else:
+        for line in lines:
+            if line.strip():
+                yield line
+
+
+class ImportService:
+    def __init__(
+        self,
+        repo: ImportRepository,
+        tags: TagRepository,
+        feed: FeedRepository,
+        batch_size: int = 5000,
+        progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> None:
+        self._repo = repo
+        self._tags = tags
+        self._feed = feed
+        self._batch_size = batch_size
+        self._progress = progress
+
+    def _reject(self, report: ImportReport, line: int, error: str) -> None:
+        report.rejected += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(f"record {line}: {error}")
+
+    async def _run(
+        self,
+        records: Iterable[Record],
+        schema: Type[BaseModel],
+        columns: tuple,
+        merge: Callable,
+        overrides: dict,
+    ) -> ImportReport:
+        report = ImportReport()
+        batch: List[tuple] = []
+
+        async def flush() -> None:
+            merged, rejected = await merge(batch)
+            report.imported += merged
+            report.rejected += rejected
+            batch.clear()
+            await self._repo.commit()
+            if self._progress:
+                self._progress(report)
+
+        for line, record in enumerate(records, start=1):
+            report.received += 1
+            try:
+                data = json.loads(record) if isinstance(record, str) else record
+                item = schema.model_validate({**data, **overrides})
+            except (ValueError, TypeError) as exc:
+                self._reject(report, line, _describe(exc))
+                continue
+            batch.append(tuple(getattr(item, column) for column in columns))
+            if len(batch) >= self._batch_size:
+                await flush()
+        if batch:
+            await flush()
+        return report
+
+    async def _merge_articles(self, batch: List[tuple]) -> tuple:
+        result = await self._repo.merge_articles(batch)
+        await self._tags.adjust(result.tag_deltas)
+        await self._feed.fan_out_many(result.ids, replaced_ids=result.replaced_ids)
+        if result.merged:
+            await publish(self._repo.db, "article", list=True)
+        for ids in chunked(result.replaced_ids):
+            await publish(self._repo.db, "article", ids=ids)
+        return result.merged, result.rejected
+
+    async def _merge_comments(self, batch: List[tuple]) -> tuple:
+        result = await self._repo.merge_comments(batch)
+        for ids in chunked(result.article_ids):
+            await publish(self._repo.db, "comment", article_ids=ids)
+        return result.merged, result.rejected
+
+    @staticmethod
+    def _overrides(author_id: Optional[int], keep_ids: bool) -> dict:
+        overrides = {} if keep_ids else {"id": None}
+        if author_id is not None:
+            overrides["author_id"] = author_id
+        return overrides
+
+    async def import_articles(self, records: Iterable[Record], author_id: Optional[int] = None, keep_ids: bool = True) -> ImportReport:
+        overrides = self._overrides(author_id, keep_ids)
+        report = await self._run(records, ArticleImport, ARTICLE_COLUMNS, self._merge_articles, overrides)
+        if keep_ids:
+            await self._repo.sync_sequence("articles")
+            await self._repo.commit()
+        return report
+
+    async def import_comments(self, records: Iterable[Record], author_id: Optional[int] = None, keep_ids: bool = True) -> ImportReport:
+        overrides = self._overrides(author_id, keep_ids)
+        report = await self._run(records, CommentImport, COMMENT_COLUMNS, self._merge_comments, overrides)
+        if keep_ids:
+            await self._repo.sync_sequence("comments")
+            await self._repo.commit()
+        return report
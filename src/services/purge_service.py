@@ -0,0 +1,77 @@
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from core.events import chunked, publish
+from repositories.article_repo import ArticleRepository
+from repositories.comment_repo import CommentRepository
+from repositories.follow_repo import FollowRepository
+from repositories.tag_repo import TagRepository
+from repositories.user_repo import UserRepository
+
+
+class UserPurgeService:
+    def __init__(
+        self,
+        users: UserRepository,
+        articles: ArticleRepository,
+        comments: CommentRepository,
+        tags: TagRepository,
+        follows: FollowRepository,
+        batch_size: int = 5000,
+        progress: Optional[Callable[[str, int], None]] = None,
+    ) -> None:
+        self._users = users
+        self._articles = articles
+        self._comments = comments
+        self._tags = tags
+        self._follows = follows
+        self._batch_size = batch_size
+        self._progress = progress
+
+    async def _commit(self, stage: str, deleted: int) -> None:
+        await self._users.db.commit()
+        if self._progress:
+            self._progress(stage, deleted)
+
+    async def purge(self, user_id: int) -> Dict[str, int]:
+        report = {"comments": 0, "articles": 0, "users": 0}
+
+        while True:
+            deleted = await self._comments.delete_batch_on_articles_of(user_id, self._batch_size)
+            if not deleted:
+                break
+            report["comments"] += deleted
+            await self._commit("comments", report["comments"])
+
+        while True:
+            article_ids = await self._comments.delete_batch_by_author(user_id, self._batch_size)
+            if not article_ids:
+                break
+            counts = Counter(article_ids)
+            await self._articles.adjust_comments_counts({article_id: -n for article_id, n in counts.items()})
+            for ids in chunked(list(counts)):
+                await publish(self._users.db, "comment", article_ids=ids)
+            report["comments"] += len(article_ids)
+            await self._commit("comments", report["comments"])
+
+        while True:
+            rows = await self._articles.delete_batch_by_author(user_id, self._batch_size)
+            if not rows:
+                break
+            deltas = Counter()
+            for row in rows:
+                deltas.subtract(set(row.tag_list or []))
+            await self._tags.adjust(deltas)
+            for ids in chunked([row.id for row in rows]):
+                await publish(self._users.db, "article", ids=ids, list=True)
+            report["articles"] += len(rows)
+            await self._commit("articles", report["articles"])
+
+        await self._follows.release_follower(user_id)
+        user = await self._users.get_by_id(user_id)
+        if user is not None:
+            await self._users.delete(user)
+            report["users"] = 1
+        await publish(self._users.db, "user", user_id)
+        await self._commit("users", report["users"])
+        return report
@@ -1,6 +1,7 @@
 from typing import Optional
 
-from core.security import hash_password, verify_password, create_access_token
+from core.events import publish
+from core.security import create_access_token, password_hasher
 from models.user import User
 from repositories.user_repo import UserRepository
 
@@ -12,12 +13,12 @@ class UserService:
     async def register(self, email: str, username: str, password: str, bio: Optional[str] = None, image_url: Optional[str] = None) -> User:
         if await self._repo.get_by_email(email):
             raise ValueError("email already registered")
-        user = User(email=email, username=username, password_hash=hash_password(password), bio=bio, image_url=image_url)
+        user = User(email=email, username=username, password_hash=await password_hasher.hash(password), bio=bio, image_url=image_url)
         return await self._repo.create(user)
 
     async def authenticate(self, email: str, password: str) -> str:
         user = await self._repo.get_by_email(email)
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await password_hasher.verify(password, user.password_hash):
             raise ValueError("invalid credentials")
         return create_access_token(str(user.id))
 
@@ -35,10 +36,11 @@ class UserService:
         if username is not None:
             user.username = username
         if password is not None:
-            user.password_hash = hash_password(password)
+            user.password_hash = await password_hasher.hash(password)
         if bio is not None:
             user.bio = bio
         if image_url is not None:
             user.image_url = image_url
         await self._repo.update(user)
+        await publish(self._repo.db, "user", user.id)
         return user
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from core.config import settings
+from core.database import AsyncUnitOfWork
+from repositories.view_repo import ViewRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _bucket_start(now: float, bucket_seconds: int) -> datetime:
+    return datetime.fromtimestamp(now // bucket_seconds * bucket_seconds, tz=timezone.utc)
+
+
+class ViewCounter:
+    def __init__(self, flush_interval: float, max_pending: int, bucket_seconds: int) -> None:
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.bucket_seconds = bucket_seconds
+        self._pending: Dict[int, int] = {}
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self.recorded = 0
+        self.flushes = 0
+        self.flushed_views = 0
+        self.failures = 0
+
+    def record(self, article_id: int) -> None:
+        self._pending[article_id] = self._pending.get(article_id, 0) + 1
+        self.recorded += 1
+        if len(self._pending) >= self.max_pending:
+            self._full.set()
+
+    def _restore(self, pending: Dict[int, int]) -> None:
+        for article_id, n in pending.items():
+            self._pending[article_id] = self._pending.get(article_id, 0) + n
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            self._full.clear()
+            if not pending:
+                return 0
+            bucket = _bucket_start(time.time(), self.bucket_seconds)
+            try:
+                async with AsyncUnitOfWork() as session:
+                    await ViewRepository(session).add_views(pending, bucket)
+            except Exception:
+                self.failures += 1
+                logger.warning("flushing %d article view counters failed, retrying later", len(pending), exc_info=True)
+                self._restore(pending)
+                return 0
+            except BaseException:
+                self._restore(pending)
+                raise
+            self.flushes += 1
+            views = sum(pending.values())
+            self.flushed_views += views
+            return views
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending_articles": len(self._pending),
+            "pending_views": sum(self._pending.values()),
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flushed_views": self.flushed_views,
+            "failures": self.failures,
+        }
+
+
+class TrendingRefresher:
+    def __init__(self, interval: float, half_life: float, window: float, size: int) -> None:
+        self.interval = interval
+        self.half_life = half_life
+        self.window = window
+        self.size = size
+        self.last_refresh: Optional[datetime] = None
+
+    async def refresh(self) -> bool:
+        async with AsyncUnitOfWork() as session:
+            repo = ViewRepository(session)
+            if not await repo.try_lock_trending():
+                return False
+            computed_at = await repo.trending_computed_at()
+            if computed_at is not None and computed_at > datetime.now(timezone.utc) - timedelta(seconds=self.interval / 2):
+                return False
+            ranked = await repo.rebuild_trending(self.half_life, self.window, self.size)
+        self.last_refresh = datetime.now(timezone.utc)
+        logger.info("trending ranking rebuilt with %d articles", ranked)
+        return True
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("trending refresh failed", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+view_counter = ViewCounter(
+    flush_interval=settings.view_flush_interval_seconds,
+    max_pending=settings.view_buffer_max_articles,
+    bucket_seconds=settings.view_bucket_seconds,
+)
+trending_refresher = TrendingRefresher(
+    interval=settings.trending_refresh_seconds,
+    half_life=settings.trending_half_life_hours * 3600,
+    window=settings.trending_window_hours * 3600,
+    size=settings.trending_size,
+)
@@ -0,0 +1,71 @@
+import asyncio
+import os
+from pathlib import Path
+
+os.environ["POSTGRES_DB"] = os.getenv("TEST_POSTGRES_DB", "blog_test")
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["INVALIDATION_BUS_ENABLED"] = "false"
+os.environ["VIEW_COUNTING_ENABLED"] = "false"
+os.environ["ADMISSION_ENABLED"] = "false"
+os.environ["WARMUP_CONNECTIONS"] = "1"
+
+import asyncpg
+import httpx
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from core.config import settings
+from core.database import AsyncUnitOfWork
+
+ROOT = Path(__file__).resolve().parent.parent
+TABLES = "users, articles, comments, tag_counts, follows, timeline_entries, article_view_buckets, trending_articles"
+
+
+async def _recreate_database() -> None:
+    connection = await asyncpg.connect(
+        host=settings.postgres_host,
+        port=settings.postgres_port,
+        user=settings.postgres_user,
+        password=settings.postgres_password,
+        database="postgres",
+    )
+    try:
+        await connection.execute(f'DROP DATABASE IF EXISTS "{settings.postgres_db}" WITH (FORCE)')
+        await connection.execute(f'CREATE DATABASE "{settings.postgres_db}"')
+    finally:
+        await connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    try:
+        asyncio.run(_recreate_database())
+    except (OSError, asyncpg.PostgresError) as exc:
+        pytest.skip(f"PostgreSQL is not available: {exc}")
+    # no ini file: alembic's fileConfig would disable the application loggers
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def app():
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        async with AsyncUnitOfWork() as session:
+            await session.execute(text(f"TRUNCATE {TABLES} RESTART IDENTITY CASCADE"))
+        yield app
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
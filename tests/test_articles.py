@@ -0,0 +1,51 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def auth(client):
+    response = await client.post(
+        "/api/users",
+        json={"email": "writer@example.com", "username": "writer", "password": "secret-password"},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['token']['access_token']}"}
+
+
+async def _search(client, q: str) -> list:
+    response = await client.get("/api/articles/search", params={"q": q})
+    assert response.status_code == 200, response.text
+    return [hit["id"] for hit in response.json()["articles"]]
+
+
+async def test_create_article_is_searchable(client, auth):
+    response = await client.post(
+        "/api/articles",
+        json={"title": "Vacuum tuning", "description": "autovacuum thresholds", "body": "dead tuples", "tag_list": ["postgres"]},
+        headers=auth,
+    )
+    assert response.status_code == 200, response.text
+    article = response.json()
+    assert article["title"] == "Vacuum tuning"
+    assert await _search(client, "vacuum") == [article["id"]]
+
+
+async def test_update_article_refreshes_search_vector(client, auth):
+    response = await client.post(
+        "/api/articles",
+        json={"title": "Draft", "description": "placeholder", "body": "nothing yet"},
+        headers=auth,
+    )
+    assert response.status_code == 200, response.text
+    article_id = response.json()["id"]
+
+    response = await client.put(
+        f"/api/articles/{article_id}",
+        json={"title": "Checkpoint spreading", "body": "checkpoint_completion_target"},
+        headers=auth,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["title"] == "Checkpoint spreading"
+    assert await _search(client, "checkpoint") == [article_id]
+    assert await _search(client, "draft") == []
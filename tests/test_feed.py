@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from core.database import AsyncUnitOfWork
+from models.article import Article
+from repositories.feed_repo import FeedRepository
+from repositories.follow_repo import FollowRepository
+from repositories.import_repo import ImportRepository
+from repositories.tag_repo import TagRepository
+from services.feed_service import FeedService
+from services.import_service import ImportService
+
+pytestmark = pytest.mark.anyio
+
+AUTHOR = 1
+FOLLOWERS = (2, 3, 4)
+
+
+@pytest.fixture
+async def users(app):
+    async with AsyncUnitOfWork() as session:
+        await session.execute(
+            text(
+                "INSERT INTO users (username, email, password_hash) "
+                "SELECT 'user' || n, 'user' || n || '@example.com', 'x' FROM generate_series(1, 4) AS n"
+            )
+        )
+
+
+def _service(session) -> FeedService:
+    return FeedService(FollowRepository(session), FeedRepository(session), fanout_max_followers=2, backfill_size=10)
+
+
+async def _publish(title: str) -> int:
+    async with AsyncUnitOfWork() as session:
+        article_id = (
+            await session.execute(
+                text("INSERT INTO articles (title, description, body, author_id) VALUES (:title, '', '', :author) RETURNING id"),
+                {"title": title, "author": AUTHOR},
+            )
+        ).scalar_one()
+        await _service(session).publish(await session.get(Article, article_id))
+    return article_id
+
+
+async def _follow(follower_id: int) -> None:
+    async with AsyncUnitOfWork() as session:
+        await _service(session).follow(follower_id, AUTHOR)
+
+
+async def _feed(user_id: int) -> list:
+    async with AsyncUnitOfWork() as session:
+        rows, _ = await _service(session).page(user_id, limit=20)
+    return [row.id for row in rows]
+
+
+async def test_articles_survive_a_downward_threshold_crossing(users):
+    await _follow(2)
+    await _follow(3)
+    pushed = await _publish("pushed")
+    await _follow(4)
+    pulled = await _publish("pulled while popular")
+    async with AsyncUnitOfWork() as session:
+        followers = await _service(session).unfollow(4, AUTHOR)
+    assert followers == 2
+    after = await _publish("after dropping below the threshold")
+
+    for follower_id in (2, 3):
+        assert await _feed(follower_id) == [after, pulled, pushed]
+
+
+async def test_author_in_push_mode_pushes_and_backfills(users):
+    first = await _publish("before following")
+    await _follow(2)
+    second = await _publish("after following")
+    async with AsyncUnitOfWork() as session:
+        pushed = (await session.execute(text("SELECT article_id FROM timeline_entries WHERE user_id = 2 ORDER BY article_id"))).scalars().all()
+        pull = (await session.execute(text("SELECT feed_pull FROM users WHERE id = :id"), {"id": AUTHOR})).scalar_one()
+    assert pushed == [first, second]
+    assert not pull
+
+
+async def test_imported_articles_are_fanned_out(users):
+    await _follow(2)
+    record = {"title": "imported", "description": "d", "body": "b", "created_at": "2024-01-01T00:00:00+00:00"}
+    async with AsyncUnitOfWork() as session:
+        service = ImportService(ImportRepository(session), TagRepository(session), FeedRepository(session))
+        await service.import_articles([json.dumps(record)], author_id=AUTHOR, keep_ids=False)
+    assert len(await _feed(2)) == 1
+    article_id = (await _feed(2))[0]
+
+    record.update(id=article_id, created_at="2024-02-01T00:00:00+00:00")
+    async with AsyncUnitOfWork() as session:
+        service = ImportService(ImportRepository(session), TagRepository(session), FeedRepository(session))
+        await service.import_articles([json.dumps(record)], author_id=AUTHOR, keep_ids=True)
+    async with AsyncUnitOfWork() as session:
+        entries = (await session.execute(text("SELECT article_id, created_at FROM timeline_entries WHERE user_id = 2"))).all()
+    assert [(entry.article_id, entry.created_at.month) for entry in entries] == [(article_id, 2)]
@@ -0,0 +1,26 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from core.database import AsyncUnitOfWork
+from core.security import password_hasher
+
+pytestmark = pytest.mark.anyio
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_pool_checked_out_gauge_follows_checkout_and_checkin(app):
+    before = _sample("db_pool_checked_out", pool="primary")
+    async with AsyncUnitOfWork() as session:
+        await session.execute(text("SELECT 1"))
+        assert _sample("db_pool_checked_out", pool="primary") == before + 1
+    assert _sample("db_pool_checked_out", pool="primary") == before
+
+
+async def test_password_hash_pending_gauge_returns_to_zero(app):
+    password_hash = await password_hasher.hash("secret")
+    assert await password_hasher.verify("secret", password_hash)
+    assert _sample("password_hash_pending") == 0
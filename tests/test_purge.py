@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import text
+
+from core.cache import principal_cache
+from core.database import AsyncUnitOfWork
+from core.response_cache import article_cache
+from repositories.article_repo import ArticleRepository
+from repositories.comment_repo import CommentRepository
+from repositories.follow_repo import FollowRepository
+from repositories.tag_repo import TagRepository
+from repositories.user_repo import UserRepository
+from services.purge_service import UserPurgeService
+
+pytestmark = pytest.mark.anyio
+
+PURGED, OTHER = 1, 2
+
+
+@pytest.fixture
+async def seeded(app):
+    async with AsyncUnitOfWork() as session:
+        await session.execute(
+            text(
+                "INSERT INTO users (username, email, password_hash) "
+                "SELECT 'user' || n, 'user' || n || '@example.com', 'x' FROM generate_series(1, 2) AS n"
+            )
+        )
+        await session.execute(
+            text(
+                "INSERT INTO articles (title, description, body, tag_list, author_id) VALUES "
+                "('purged', '', '', '{}', 1), ('commented', '', '', '{}', 2), ('untouched', '', '', '{}', 2)"
+            )
+        )
+        await session.execute(text("INSERT INTO comments (body, article_id, author_id) VALUES ('hi', 2, 1)"))
+        await session.execute(text("UPDATE articles SET comments_count = 1 WHERE id = 2"))
+
+
+async def test_purge_invalidates_only_what_it_touched(client, seeded):
+    article_cache.clear()
+    for url in ("/api/articles", "/api/articles/1", "/api/articles/2", "/api/articles/3"):
+        response = await client.get(url)
+        assert response.status_code == 200, response.text
+    principal_cache.set(PURGED, {"id": PURGED})
+    principal_cache.set(OTHER, {"id": OTHER})
+
+    async with AsyncUnitOfWork() as session:
+        service = UserPurgeService(
+            UserRepository(session),
+            ArticleRepository(session),
+            CommentRepository(session),
+            TagRepository(session),
+            FollowRepository(session),
+            batch_size=1,
+        )
+        report = await service.purge(PURGED)
+
+    assert report == {"comments": 1, "articles": 1, "users": 1}
+    assert set(article_cache._entries) == {"/api/articles/3?"}
+    assert principal_cache.get(PURGED) is None
+    assert principal_cache.get(OTHER) == {"id": OTHER}
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import text
+
+from core.database import AsyncUnitOfWork
+from core.response_cache import article_cache
+from core.tracing import query_budget
+
+pytestmark = pytest.mark.anyio
+
+AUTHORS = 12
+ARTICLES = 30
+COMMENTS = 30
+
+
+@pytest.fixture
+async def seeded(app):
+    async with AsyncUnitOfWork() as session:
+        await session.execute(
+            text(
+                "INSERT INTO users (username, email, password_hash) "
+                "SELECT 'author' || n, 'author' || n || '@example.com', 'x' FROM generate_series(1, :n) AS n"
+            ),
+            {"n": AUTHORS},
+        )
+        await session.execute(
+            text(
+                "INSERT INTO articles (title, description, body, tag_list, author_id) "
+                "SELECT 'title ' || n, 'description', 'body', ARRAY['tag'], n % :authors + 1 FROM generate_series(1, :n) AS n"
+            ),
+            {"n": ARTICLES, "authors": AUTHORS},
+        )
+        await session.execute(
+            text(
+                "INSERT INTO comments (body, article_id, author_id) "
+                "SELECT 'comment ' || n, 1, n % :authors + 1 FROM generate_series(1, :n) AS n"
+            ),
+            {"n": COMMENTS, "authors": AUTHORS},
+        )
+        await session.execute(text("UPDATE articles SET comments_count = :n WHERE id = 1"), {"n": COMMENTS})
+
+
+async def _count(client, url: str, budget: int) -> int:
+    article_cache.clear()
+    with query_budget(budget) as recorder:
+        response = await client.get(url)
+    assert response.status_code == 200, response.text
+    return recorder.count
+
+
+def _authors(items):
+    assert items and all(item["author"]["username"].startswith("author") for item in items)
+    return {item["author"]["username"] for item in items}
+
+
+async def test_article_list_with_authors_is_constant(client, seeded):
+    counts = set()
+    for limit in (5, 10, 25):
+        counts.add(await _count(client, f"/api/articles?include=author&limit={limit}", budget=2))
+        response = await client.get(f"/api/articles?include=author&limit={limit}")
+        assert len(_authors(response.json()["articles"])) == min(limit, AUTHORS)
+    assert counts == {2}
+
+
+async def test_comment_list_with_authors_is_constant(client, seeded):
+    counts = set()
+    for limit in (5, 10, 25):
+        counts.add(await _count(client, f"/api/articles/1/comments?include=author&limit={limit}", budget=3))
+        response = await client.get(f"/api/articles/1/comments?include=author&limit={limit}")
+        assert len(_authors(response.json()["comments"])) == min(limit, AUTHORS)
+    assert counts == {3}
+
+
+async def test_article_with_author(client, seeded):
+    assert await _count(client, "/api/articles/1?include=author", budget=2) == 2
+    body = (await client.get("/api/articles/1?include=author")).json()
+    assert body["author"]["username"] == "author2"
+
+
+async def test_author_is_omitted_unless_included(client, seeded):
+    article_cache.clear()
+    article = (await client.get("/api/articles/1")).json()
+    comments = (await client.get("/api/articles/1/comments")).json()["comments"]
+    assert "author" not in article
+    assert comments and all("author" not in comment for comment in comments)
@@ -0,0 +1,48 @@
+import pytest
+from starlette.requests import Request
+
+from api.deps import _reads_own_writes
+from api.middleware import READ_YOUR_WRITES_COOKIE
+from core.cache import recent_writers
+from core.database import ReadSessionLocal
+from core.events import dispatch
+from core.response_cache import ResponseCache
+from core.security import create_access_token
+
+pytestmark = pytest.mark.anyio
+
+
+def _request(path: str = "/api/articles", headers: dict = None) -> Request:
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": raw})
+
+
+def test_bearer_writer_reads_from_primary():
+    recent_writers.clear()
+    headers = {"Authorization": f"Bearer {create_access_token('41')}"}
+    assert not _reads_own_writes(_request(headers=headers))
+    dispatch({"entity": "user_write", "id": 41})
+    assert _reads_own_writes(_request(headers=headers))
+    assert not _reads_own_writes(_request(headers={"Authorization": f"Bearer {create_access_token('42')}"}))
+
+
+def test_cookie_writer_reads_from_primary():
+    assert _reads_own_writes(_request(headers={"Cookie": f"{READ_YOUR_WRITES_COOKIE}=9999999999"}))
+
+
+async def test_cache_is_not_filled_from_replica(app):
+    cache = ResponseCache(maxsize=10, ttl=60, stale_ttl=0, client_max_age=0)
+    sessions = []
+
+    async def loader(session):
+        sessions.append(session)
+        return b"{}", ["articles:list"]
+
+    replica_session = ReadSessionLocal(info={"replica": True})
+    try:
+        await cache.respond(_request(), loader, replica_session)
+    finally:
+        await replica_session.close()
+    assert sessions and sessions[0] is not replica_session
+    assert not sessions[0].info.get("replica")
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,93 @@
+import logging
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from fastapi import FastAPI
+
+from core.database import AsyncUnitOfWork
+from core.metrics import MetricsMiddleware
+from core.tracing import QueryBudgetExceeded, QueryRecorder, QueryTracingMiddleware, query_budget, record_queries
+
+pytestmark = pytest.mark.anyio
+
+
+async def _select_each(ids):
+    async with AsyncUnitOfWork() as session:
+        for article_id in ids:
+            await session.execute(text("SELECT CAST(:id AS integer)"), {"id": article_id})
+
+
+async def test_query_budget_passes_within_budget(app):
+    with query_budget(3) as recorder:
+        await _select_each([1, 2, 3])
+    assert recorder.count == 3
+
+
+async def test_query_budget_reports_statements_over_budget(app):
+    with pytest.raises(QueryBudgetExceeded) as excinfo:
+        with query_budget(2):
+            await _select_each([1, 2, 3])
+    assert "3 queries executed, budget is 2" in str(excinfo.value)
+
+
+async def test_nested_recorders_report_to_parents(app):
+    with record_queries() as outer:
+        await _select_each([1])
+        with record_queries() as inner:
+            await _select_each([2, 3])
+    assert (outer.count, inner.count) == (3, 2)
+
+
+def test_repeated_shapes_normalize_parameters():
+    recorder = QueryRecorder()
+    for n in range(5):
+        recorder.add(f"SELECT * FROM users WHERE id IN ({', '.join(['$1::INTEGER'] * (n + 2))})", 0.001)
+        recorder.add("SELECT * FROM articles WHERE id = $1::INTEGER", 0.001)
+    recorder.add("SELECT 1", 0.001)
+    assert recorder.repeated_shapes(5) == [
+        ("SELECT * FROM users WHERE id IN (?, ...)", 5),
+        ("SELECT * FROM articles WHERE id = ?", 5),
+    ]
+
+
+def _traced_app(queries: int) -> MetricsMiddleware:
+    inner = FastAPI()
+
+    @inner.get("/items")
+    async def items():
+        await _select_each(range(queries))
+        return {"status": "ok"}
+
+    return MetricsMiddleware(QueryTracingMiddleware(inner, server_timing=True, n_plus_one_threshold=5))
+
+
+async def _get(asgi_app, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_n_plus_one_is_logged(app, caplog):
+    with caplog.at_level(logging.WARNING, logger="core.tracing"):
+        response = await _get(_traced_app(6), "/items")
+    assert 'desc="6 queries"' in response.headers["server-timing"]
+    assert any("possible N+1 on GET /items: 6 x SELECT CAST" in record.getMessage() for record in caplog.records)
+
+
+async def test_below_threshold_is_not_logged(app, caplog):
+    with caplog.at_level(logging.WARNING, logger="core.tracing"):
+        await _get(_traced_app(4), "/items")
+    assert not any("possible N+1" in record.getMessage() for record in caplog.records)
+
+
+async def test_metrics_and_tracing_share_one_recorder(app):
+    def observed() -> float:
+        return REGISTRY.get_sample_value("db_queries_per_request_sum", {"route": "/items"}) or 0.0
+
+    before = observed()
+    with record_queries() as outer:
+        response = await _get(_traced_app(3), "/items")
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    assert observed() - before == 3
+    assert outer.count == 3
@@ -0,0 +1,42 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from core.database import AsyncUnitOfWork
+from repositories.view_repo import ViewRepository
+
+pytestmark = pytest.mark.anyio
+
+ARTICLES = 50
+FLUSHES = 12
+
+
+async def test_concurrent_flushes_add_up(app):
+    async with AsyncUnitOfWork() as session:
+        await session.execute(text("INSERT INTO users (username, email, password_hash) VALUES ('reader', 'reader@example.com', 'x')"))
+        await session.execute(
+            text("INSERT INTO articles (title, description, body, author_id) SELECT 'a', 'd', 'b', 1 FROM generate_series(1, :n)"),
+            {"n": ARTICLES},
+        )
+    bucket = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(7)
+    batches = [{article_id: rng.randint(1, 5) for article_id in rng.sample(range(1, ARTICLES + 1), 40)} for _ in range(FLUSHES)]
+
+    async def flush(counts):
+        async with AsyncUnitOfWork() as session:
+            await ViewRepository(session).add_views(dict(reversed(list(counts.items()))), bucket)
+
+    await asyncio.gather(*(flush(counts) for counts in batches))
+
+    expected = {}
+    for counts in batches:
+        for article_id, n in counts.items():
+            expected[article_id] = expected.get(article_id, 0) + n
+    async with AsyncUnitOfWork() as session:
+        views = dict((await session.execute(text("SELECT id, views_count FROM articles WHERE views_count > 0"))).all())
+        buckets = dict((await session.execute(text("SELECT article_id, views FROM article_view_buckets"))).all())
+    assert views == expected
+    assert buckets == expected